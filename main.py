@@ -11,29 +11,61 @@ custom security middleware to block denied requests.
 Usage:
     Run the application using Uvicorn server:
 
-        uvicorn main:app --host 127.0.0.1 --port 8000 --reload
+        uvicorn main:app --host 127.0.0.1 --port 8000 --loop uvloop --reload
 """
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from src.middleware.security import block_denied_requests
+from src.middleware.security import DenyASGI
+from src.middleware.rate_limit import RateLimitASGI
 from src.limiter.limiter import limiter
 from src.api import health, auth, users, contacts
 from src.services.cloudinary_service import CloudinaryService
+from src.services.redis_cache import close_redis
 from src.config.settings import settings
+from src.database.db import sessionmanager
+from src.core.logger import logger
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
 
+    On startup installs a single, globally sized default thread pool, creates
+    the app-wide Cloudinary service and pre-warms the database connection pool.
+    On shutdown closes the Cloudinary HTTP client, the Redis connection pool
+    and the thread pool.
 
-app = FastAPI()
-app.state.limiter = limiter
-app.add_middleware(SlowAPIMiddleware)
-app.state.cloudinary_service = CloudinaryService(
-    cloud_name=settings.CLD_NAME,
-    api_key=settings.CLD_API_KEY,
-    api_secret=settings.CLD_API_SECRET,
+    Args:
+        app (FastAPI): The FastAPI application instance.
+    """
+    executor = ThreadPoolExecutor(max_workers=settings.THREAD_POOL_SIZE)
+    asyncio.get_running_loop().set_default_executor(executor)
+    app.state.cloudinary_service = CloudinaryService(
+        cloud_name=settings.CLD_NAME,
+        api_key=settings.CLD_API_KEY,
+        api_secret=settings.CLD_API_SECRET,
+    )
+    try:
+        await sessionmanager.warm_up()
+    except Exception as e:
+        logger.error(f"Database pool warm-up failed: {e}")
+    yield
+    await app.state.cloudinary_service.aclose()
+    await close_redis()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(
+    default_response_class=ORJSONResponse, lifespan=lifespan, redirect_slashes=False
 )
+app.add_middleware(RateLimitASGI, limiter=limiter)
 
 app.add_middleware(
     CORSMiddleware,
@@ -43,26 +75,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.middleware("http")(block_denied_requests)
-
-
-@app.exception_handler(RateLimitExceeded)
-async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    """
-    Exception handler for rate limit exceeded errors.
-
-    Args:
-        request (Request): The incoming HTTP request.
-        exc (RateLimitExceeded): The rate limit exceeded exception.
-
-    Returns:
-        JSONResponse: Response with status code 429 and error message.
-    """
-    return JSONResponse(
-        status_code=429,
-        content={"error": "Перевищено ліміт запитів. Спробуйте пізніше."},
-    )
-
+app.add_middleware(DenyASGI)
 
 app.include_router(contacts.router, prefix="/api")
 app.include_router(health.router, prefix="/api")
@@ -72,4 +85,4 @@ app.include_router(users.router, prefix="/api")
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    uvicorn.run("main:app", host="127.0.0.1", port=8000, loop="uvloop", reload=True)
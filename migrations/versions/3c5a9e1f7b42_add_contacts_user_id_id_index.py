@@ -0,0 +1,39 @@
+"""Add contacts (user_id, id) index
+
+Revision ID: 3c5a9e1f7b42
+Revises: 16fba0065585
+Create Date: 2026-10-14 11:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5a9e1f7b42"
+down_revision: Union[str, None] = "16fba0065585"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_user_id_id",
+            "contacts",
+            ["user_id", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_user_id_id",
+            table_name="contacts",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,42 @@
+"""Scope contacts email uniqueness to user
+
+Revision ID: 7d2b4f8e1a63
+Revises: 3c5a9e1f7b42
+Create Date: 2026-10-14 12:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2b4f8e1a63"
+down_revision: Union[str, None] = "3c5a9e1f7b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_user_email",
+            "contacts",
+            ["user_id", "email"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint("contacts_email_key", "contacts", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint("contacts_email_key", "contacts", ["email"])
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_user_email",
+            table_name="contacts",
+            postgresql_concurrently=True,
+        )
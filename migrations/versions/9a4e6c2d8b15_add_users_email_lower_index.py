@@ -0,0 +1,44 @@
+"""Add unique functional LOWER(email) index on users
+
+Revision ID: 9a4e6c2d8b15
+Revises: 7d2b4f8e1a63
+Create Date: 2026-10-14 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e6c2d8b15"
+down_revision: Union[str, None] = "7d2b4f8e1a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Emails are stored lowercased from now on; existing case-only duplicates
+    # make this fail on the users.email unique constraint and must be merged first.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email_lower",
+            "users",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_email_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,45 @@
+"""Constrain users.role to the UserRole values
+
+Revision ID: b3f71c9e4a20
+Revises: 9a4e6c2d8b15
+Create Date: 2026-10-14 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f71c9e4a20"
+down_revision: Union[str, None] = "9a4e6c2d8b15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The model maps role as a non-native Enum(UserRole): VARCHAR(5) with a CHECK.
+    # Rows with any other role value make this fail and must be fixed first.
+    op.alter_column(
+        "users",
+        "role",
+        existing_type=sa.String(),
+        type_=sa.String(length=5),
+        existing_nullable=False,
+    )
+    op.create_check_constraint("ck_users_role", "users", "role IN ('user', 'admin')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ck_users_role", "users", type_="check")
+    op.alter_column(
+        "users",
+        "role",
+        existing_type=sa.String(length=5),
+        type_=sa.String(),
+        existing_nullable=False,
+    )
@@ -18,11 +18,10 @@ Endpoints:
 - POST /reset-password: Reset password with token
 """
 
-import json
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError, jwt
+from jwt.exceptions import InvalidTokenError as JWTError
 
 from src.schemas import (
     UserCreate,
@@ -35,13 +34,18 @@ from src.schemas import (
 )
 from src.services.auth import (
     create_access_token,
-    Hash,
+    hasher,
+    hash_password,
+    verify_password,
     get_email_from_token,
     create_refresh_token,
     verify_refresh_token,
     create_email_token,
+    decode_token,
+    invalidate_cached_user,
+    encode_cached_user,
+    USER_CACHE_TTL,
 )
-from src.database.models import UserRole
 from src.services.users import UserService
 from src.services.redis_cache import get_redis
 from src.database.db import get_db
@@ -76,20 +80,20 @@ async def register_user(
     """
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Користувач з таким email вже існує",
-        )
-
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    existing_user = await user_service.get_user_by_email_or_username(
+        user_data.email, user_data.username
+    )
+    if existing_user:
+        if existing_user.email.lower() == user_data.email.lower():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Користувач з таким email вже існує",
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким іменем вже існує",
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await hash_password(user_data.password)
     new_user = await user_service.create_user(user_data)
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, str(request.base_url)
@@ -115,15 +119,19 @@ async def login_user(
     Returns:
         dict: Access token, refresh token and token type.
     """
-    logger.debug(f"Username: {form_data.username}, Password: {form_data.password}")
+    logger.debug("Login attempt: user=%s", form_data.username)
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неправильний логін або пароль",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if hasher.needs_rehash(user.hashed_password):
+        await user_service.update_password(
+            user.id, await hash_password(form_data.password)
+        )
     if not user.confirmed:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -132,23 +140,14 @@ async def login_user(
 
     access_token = await create_access_token(data={"sub": user.username})
     refresh_token = await create_refresh_token(data={"sub": user.username})
-    user.refresh_token = refresh_token
-    await db.commit()
-    await db.refresh(user)
+    await user_service.update_refresh_token(user.id, refresh_token)
 
     try:
         redis = await get_redis()
-        user_data = {
-            "id": str(user.id),
-            "username": user.username,
-            "email": user.email,
-            "confirmed": user.confirmed,
-            "role": user.role.value if isinstance(user.role, UserRole) else user.role,
-        }
-        await redis.set(f"user:{user.username}", json.dumps(user_data), ex=3600)
-        logger.info(f"User {user.username} cached in Redis")
+        await redis.set(f"user:{user.username}", encode_cached_user(user), ex=USER_CACHE_TTL)
+        logger.info("User %s cached in Redis", user.username)
     except Exception as e:
-        logger.exception(f"Redis caching failed for user {user.username}")
+        logger.exception("Redis caching failed for user %s", user.username)
 
     return {
         "access_token": access_token,
@@ -215,6 +214,7 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     if user.confirmed:
         return {"message": "Ваша електронна пошта вже підтверджена"}
     await user_service.confirmed_email(email)
+    await invalidate_cached_user(user.username)
     return {"message": "Електронну пошту підтверджено"}
 
 
@@ -309,11 +309,7 @@ async def reset_password(
         dict: Message about password reset success.
     """
     try:
-        payload = jwt.decode(
-            body.token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+        payload = decode_token(body.token, settings.JWT_SECRET)
         email = payload.get("sub")
         scope = payload.get("scope")
         if not email or scope != "password_reset":
@@ -326,9 +322,8 @@ async def reset_password(
     if not user:
         raise HTTPException(status_code=400, detail="User not found")
 
-    hashed_password = Hash().get_password_hash(body.new_password)
-    user.hashed_password = hashed_password
-    await db.commit()
-    await db.refresh(user)
+    hashed_password = await hash_password(body.new_password)
+    await user_service.update_password(user.id, hashed_password)
+    await invalidate_cached_user(user.username)
 
     return {"message": "Пароль успішно змінено"}
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from typing import List
 
 from src.schemas import ContactCreate, ContactUpdate, ContactResponse
@@ -9,8 +9,29 @@ from src.services.auth import get_current_user
 from src.database.models import User
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Slash redirects are disabled app-wide, so the collection routes are
+# registered for both "/contacts" and "/contacts/" instead of answering one with a 307.
 router = APIRouter(prefix="/contacts")
 
+LIST_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether an If-None-Match header value matches the given ETag.
+
+    Args:
+        if_none_match (str | None): Raw If-None-Match header value.
+        etag (str): Quoted ETag of the current representation.
+
+    Returns:
+        bool: True if any listed tag (weak or strong) or "*" matches.
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
 
 def get_service(session: AsyncSession = Depends(get_db)) -> ContactService:
     """
@@ -27,26 +48,40 @@ def get_service(session: AsyncSession = Depends(get_db)) -> ContactService:
     return service
 
 
-@router.get("/", response_model=List[ContactResponse])
+@router.get("", responses={200: {"model": List[ContactResponse]}})
+@router.get("/", include_in_schema=False)
 async def list_contacts(
     user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 10,
+    after_id: int | None = None,
+    if_none_match: str | None = Header(None),
     service: ContactService = Depends(get_service),
 ):
     """
     Get a list of contacts for the current user with pagination.
 
+    Responses carry an ETag; a request whose If-None-Match matches the current
+    page gets an empty 304 instead of the body.
+
     Args:
         user (User): Current authenticated user.
         skip (int): Number of records to skip (offset).
         limit (int): Maximum number of contacts to return.
+        after_id (int | None): ID of the last contact of the previous page; enables keyset pagination.
+        if_none_match (str | None): ETag(s) the client already holds.
         service (ContactService): Contact service instance.
 
     Returns:
-        List[ContactResponse]: List of user's contacts.
+        Response: JSON list of user's contacts, or 304 Not Modified.
     """
-    return await service.list_contacts(user, skip=skip, limit=limit)
+    body, etag = await service.list_contacts_json(
+        user, skip=skip, limit=limit, after_id=after_id
+    )
+    headers = {"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -69,7 +104,10 @@ async def get_contact(
     return await service.get_contact_by_id(contact_id, user)
 
 
-@router.post("/", response_model=ContactResponse, status_code=201)
+@router.post("", response_model=ContactResponse, status_code=201)
+@router.post(
+    "/", response_model=ContactResponse, status_code=201, include_in_schema=False
+)
 async def create_contact(
     contact_data: ContactCreate,
     service: ContactService = Depends(get_service),
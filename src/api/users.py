@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, Request, HTTPException
+import shutil
+import tempfile
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import File, UploadFile
+from starlette.concurrency import run_in_threadpool
 from src.schemas import User as UserSchema
 from src.database.models import User
-from src.services.auth import get_current_user
-from src.limiter.limiter import limiter
+from src.services.auth import get_current_user, invalidate_cached_user
 from src.database.db import get_db
 from src.services.cloudinary_service import CloudinaryService
 from src.dependencies.cloudinary_dep import get_cloudinary_service
@@ -12,23 +15,51 @@ from src.dependencies.role_dep import require_admin
 from src.services.users import UserService
 from src.core.logger import logger
 
-
 router = APIRouter(prefix="/users", tags=["users"])
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+async def detach_upload(file: UploadFile) -> UploadFile:
+    """
+    Copy an uploaded file into a new spooled temporary file.
+
+    FastAPI closes request files before background tasks run, so a file that
+    is uploaded after the response has to be detached from the request first.
+    The copy is done in chunks in the thread pool and spills to disk above 1 MiB.
 
-@router.get("/me", response_model=UserSchema)
-@limiter.limit("5/minute")
-async def me(request: Request, user: User = Depends(get_current_user)):
+    Args:
+        file (UploadFile): File received in the request.
+
+    Returns:
+        UploadFile: A copy that stays open until explicitly closed.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+    await run_in_threadpool(shutil.copyfileobj, file.file, spooled, UPLOAD_CHUNK_SIZE)
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename=file.filename, headers=file.headers)
+
+
+@router.get("/me", responses={200: {"model": UserSchema}})
+async def me(user: User = Depends(get_current_user)):
     """
     Get the current authenticated user's information.
 
-    Rate limited to 5 requests per minute.
+    The user is serialized once straight to JSON bytes instead of going
+    through response_model re-validation.
+
+    Rate limited to 5 requests per minute by the token bucket middleware.
     """
-    return user
+    return Response(
+        content=UserSchema.model_validate(user, from_attributes=True).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.patch("/avatar", response_model=UserSchema)
 async def update_avatar_user(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(),
     admin_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
@@ -37,16 +68,22 @@ async def update_avatar_user(
     """
     Update the avatar of the current admin user.
 
-    Uploads the provided file to Cloudinary and updates the user's avatar URL.
+    The avatar URL is derived from the Cloudinary public_id and stored right away;
+    the file itself is uploaded to Cloudinary in a background task after the response.
 
     Requires admin privileges.
     """
     public_id = f"RestApp/{admin_user.username}"
+    avatar_url = cloudinary_service.build_url(public_id)
 
-    avatar_url = await cloudinary_service.upload_file(file, public_id)
+    upload = await detach_upload(file)
+    background_tasks.add_task(
+        cloudinary_service.upload_file_background, upload, public_id
+    )
 
     user_service = UserService(db)
     user = await user_service.update_avatar_url(admin_user.email, avatar_url)
-    logger.info(f"Uploading avatar: {file.filename}")
+    await invalidate_cached_user(admin_user.username)
+    logger.debug("Uploading avatar filename=%s", file.filename)
 
     return user
@@ -1,6 +1,9 @@
-from pydantic import EmailStr, SecretStr, Field
+from functools import cached_property, lru_cache
+
+import ahocorasick
+from pydantic import EmailStr, SecretStr, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Literal
 
 
 class Settings(BaseSettings):
@@ -9,6 +12,10 @@ class Settings(BaseSettings):
 
     Attributes:
         DB_URL (str): Database connection URL.
+        DB_POOL_SIZE (int): Number of pooled database connections, default 20.
+        DB_MAX_OVERFLOW (int): Extra connections allowed above the pool size, default 10.
+        DB_POOL_RECYCLE_SECONDS (int): Recycle pooled connections after this many seconds, default 1800.
+        DB_STATEMENT_CACHE_SIZE (int): asyncpg statement cache size per connection, default 100 (asyncpg's default). Use 0 behind a transaction-pooling PgBouncer.
         JWT_SECRET (str): Secret key for JWT encoding.
         JWT_ALGORITHM (str): Algorithm used for JWT, default "HS256".
         JWT_EXPIRATION_SECONDS (int): JWT token expiration time in seconds.
@@ -31,14 +38,24 @@ class Settings(BaseSettings):
         CLD_API_SECRET (str): Cloudinary API secret.
 
         REDIS_URL (str): Redis connection URL, default "redis://localhost:6379".
+        REDIS_POOL_SIZE (int): Maximum number of pooled Redis connections, default 100.
+
+        THREAD_POOL_SIZE (int): Worker threads in the event loop's default executor, default 8.
+
+        LOG_LEVEL (str): Root logging level, default "INFO". Case-insensitive; set to "DEBUG" for local development.
 
         DENIED_ORIGINS (List[str]): List of denied CORS origins.
         DENIED_USER_AGENTS (List[str]): List of denied user agents.
 
-    Settings are loaded from environment variables or a `.env` file.
+    Settings are loaded from environment variables or a `.env` file
+    and are immutable after loading.
     """
 
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 100
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
@@ -61,16 +78,78 @@ class Settings(BaseSettings):
     CLD_API_SECRET: str
 
     REDIS_URL: str = "redis://localhost:6379"
+    REDIS_POOL_SIZE: int = 100
+
+    THREAD_POOL_SIZE: int = 8
+
+    LOG_LEVEL: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"] = "INFO"
 
     DENIED_ORIGINS: List[str] = Field(default_factory=list)
     DENIED_USER_AGENTS: List[str] = Field(default_factory=list)
 
     model_config = SettingsConfigDict(
+        frozen=True,
         extra="ignore",
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
     )
 
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def normalize_log_level(cls, value: str) -> str:
+        """
+        Upper-case the log level so `info` works like `INFO` in `logging.basicConfig`.
+
+        Args:
+            value (str): Raw level name from the environment.
+
+        Returns:
+            str: Upper-cased level name.
+        """
+        return value.upper() if isinstance(value, str) else value
+
+    @cached_property
+    def denied_origins_set(self) -> frozenset[str]:
+        """
+        Denied origins as a frozenset for O(1) membership checks.
+
+        Returns:
+            frozenset[str]: Set of denied origins.
+        """
+        return frozenset(self.DENIED_ORIGINS)
+
+    @cached_property
+    def denied_ua_automaton(self) -> ahocorasick.Automaton | None:
+        """
+        Aho-Corasick automaton over lower-cased denied user agents.
+
+        Allows matching all denied user-agent substrings in a single pass
+        over the incoming user-agent string.
+
+        Returns:
+            ahocorasick.Automaton | None: Built automaton, or None if no user agents are denied.
+        """
+        if not self.DENIED_USER_AGENTS:
+            return None
+        automaton = ahocorasick.Automaton()
+        for pattern in self.DENIED_USER_AGENTS:
+            automaton.add_word(pattern.lower(), pattern)
+        automaton.make_automaton()
+        return automaton
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings singleton.
+
+    Settings are parsed from the environment once and cached.
+
+    Returns:
+        Settings: Frozen application settings.
+    """
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
@@ -1,7 +1,9 @@
 import logging
 
+from src.config.settings import settings
+
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=settings.LOG_LEVEL,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
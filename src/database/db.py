@@ -1,11 +1,14 @@
+import asyncio
 import contextlib
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config.settings import settings
 
@@ -16,6 +19,11 @@ class DatabaseSessionManager:
 
     Args:
         url (str): Database connection URL.
+        pool_size (int): Number of connections kept open in the pool.
+        max_overflow (int): Extra connections allowed above pool_size under load.
+        pool_recycle (int): Seconds after which a pooled connection is replaced.
+        statement_cache_size (int): Size of asyncpg's own prepared statement cache;
+            set to 0 when connecting through a transaction-pooling PgBouncer.
 
     Attributes:
         _engine (AsyncEngine): The SQLAlchemy async engine instance.
@@ -25,10 +33,33 @@ class DatabaseSessionManager:
         Use the 'session' async context manager to acquire a database session.
     """
 
-    def __init__(self, url: str):
-        self._engine: AsyncEngine = create_async_engine(url)
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = -1,
+        statement_cache_size: int = 100,
+    ):
+        self.pool_size = pool_size
+        self._engine: AsyncEngine = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=pool_recycle,
+            query_cache_size=1200,
+            connect_args={
+                "statement_cache_size": statement_cache_size,
+                "prepared_statement_cache_size": 500,
+            },
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+            bind=self._engine,
         )
 
     @contextlib.asynccontextmanager
@@ -54,8 +85,28 @@ class DatabaseSessionManager:
         finally:
             await session.close()
 
+    async def warm_up(self) -> None:
+        """
+        Open `pool_size` connections concurrently and return them to the pool.
+
+        Called on application startup so the first requests do not pay
+        the connection setup cost.
+        """
+
+        async def ping():
+            async with self._engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(ping() for _ in range(self.pool_size)))
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+)
 
 
 async def get_db():
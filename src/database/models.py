@@ -1,8 +1,18 @@
 import enum
 from typing import Optional
 from datetime import date
-from sqlalchemy import String, Integer, Date, Boolean, DateTime, func, ForeignKey, Enum
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, backref
+from sqlalchemy import (
+    String,
+    Integer,
+    Date,
+    Boolean,
+    DateTime,
+    func,
+    ForeignKey,
+    Enum,
+    Index,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
 class Base(DeclarativeBase):
@@ -16,18 +26,22 @@ class UserRole(enum.Enum):
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_email", "user_id", "email", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     first_name: Mapped[str] = mapped_column(String(50))
     last_name: Mapped[str] = mapped_column(String(50))
-    email: Mapped[str] = mapped_column(String(100), unique=True)
+    email: Mapped[str] = mapped_column(String(100))
     phone_number: Mapped[str] = mapped_column(String(20))
     birthday: Mapped[date] = mapped_column(Date)
     additional_data: Mapped[str | None] = mapped_column(String(255), nullable=True)
     user_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), default=None
     )
-    user: Mapped["User"] = relationship("User", backref=backref("contacts"))
+    user: Mapped["User"] = relationship(back_populates="contacts", lazy="raise")
 
 
 class User(Base):
@@ -41,4 +55,18 @@ class User(Base):
     avatar: Mapped[str | None] = mapped_column(String(255), nullable=True)
     confirmed: Mapped[bool] = mapped_column(Boolean, default=False)
     refresh_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    role: Mapped[str] = mapped_column(String, default="user")
+    role: Mapped[UserRole] = mapped_column(
+        Enum(
+            UserRole,
+            native_enum=False,
+            create_constraint=True,
+            name="ck_users_role",
+        ),
+        default=UserRole.user,
+    )
+    contacts: Mapped[list["Contact"]] = relationship(
+        back_populates="user", lazy="raise"
+    )
+
+
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
@@ -1,4 +1,104 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import time
 
-limiter = Limiter(key_func=get_remote_address)
+from redis.commands.core import AsyncScript
+
+from src.services.redis_cache import get_redis
+from src.core.logger import logger
+
+TOKEN_BUCKET_SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 't', 'ts')
+local now = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local rate = tonumber(ARGV[3])
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, math.floor(tokens)}
+"""
+
+PERIODS_MS = {
+    "second": 1000,
+    "minute": 60 * 1000,
+    "hour": 60 * 60 * 1000,
+    "day": 24 * 60 * 60 * 1000,
+}
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """
+    Parse a rate string like "5/minute" into token bucket parameters.
+
+    Args:
+        rate (str): Rate in the form "<count>/<second|minute|hour|day>".
+
+    Returns:
+        tuple[int, float]: Bucket capacity and refill rate in tokens per millisecond.
+    """
+    count, period = rate.split("/")
+    capacity = int(count)
+    return capacity, capacity / PERIODS_MS[period.strip()]
+
+
+class TokenBucketLimiter:
+    """
+    Redis-backed token bucket rate limiter.
+
+    Every check is a single atomic `EVALSHA` call of a Lua script that
+    refills and consumes the bucket stored under `rl:{path}:{client}`.
+
+    Args:
+        rules (dict[str, str]): Mapping of request path to rate string, e.g. {"/api/users/me": "5/minute"}.
+    """
+
+    def __init__(self, rules: dict[str, str]):
+        self.rules = {path: parse_rate(rate) for path, rate in rules.items()}
+        self._script: AsyncScript | None = None
+
+    async def _get_script(self) -> AsyncScript:
+        if self._script is None:
+            redis = await get_redis()
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    async def hit(self, path: str, client: str) -> bool:
+        """
+        Consume one token for the given path and client.
+
+        Paths without a configured rule are always allowed. If Redis is
+        unavailable the request is allowed and the error is logged.
+
+        Args:
+            path (str): Request path.
+            client (str): Client identifier (IP address).
+
+        Returns:
+            bool: True if the request is allowed, False if the limit is exceeded.
+        """
+        rule = self.rules.get(path)
+        if rule is None:
+            return True
+        capacity, refill_per_ms = rule
+        try:
+            script = await self._get_script()
+            allowed, _ = await script(
+                keys=[f"rl:{path}:{client}"],
+                args=[int(time.time() * 1000), capacity, refill_per_ms],
+            )
+        except Exception as e:
+            logger.error(f"Rate limiter unavailable: {e}")
+            return True
+        return bool(allowed)
+
+
+limiter = TokenBucketLimiter(rules={"/api/users/me": "5/minute"})
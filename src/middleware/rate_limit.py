@@ -0,0 +1,48 @@
+import math
+
+import orjson
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.limiter.limiter import TokenBucketLimiter
+from src.middleware.responses import send_json
+
+RATE_LIMIT_BODY = orjson.dumps(
+    {"error": "Перевищено ліміт запитів. Спробуйте пізніше."}
+)
+
+
+class RateLimitASGI:
+    """
+    Pure ASGI middleware applying the Redis token bucket limiter.
+
+    The bucket is keyed by request path and client IP. When a limit is
+    exceeded, a pre-encoded 429 response is sent directly without constructing
+    a Starlette `Response`. Its `Retry-After` header is the time needed to refill
+    one token and is computed once per rule.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
+        limiter (TokenBucketLimiter): The token bucket limiter instance.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: TokenBucketLimiter):
+        self.app = app
+        self.limiter = limiter
+        self.retry_after_headers = {}
+        for path, (_, refill_per_ms) in limiter.rules.items():
+            seconds = math.ceil(1 / refill_per_ms / 1000)
+            self.retry_after_headers[path] = ((b"retry-after", str(seconds).encode()),)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.limiter.rules:
+            return await self.app(scope, receive, send)
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        if not await self.limiter.hit(scope["path"], client_ip):
+            return await send_json(
+                send, 429, RATE_LIMIT_BODY, self.retry_after_headers[scope["path"]]
+            )
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,35 @@
+from typing import Iterable
+
+from starlette.types import Send
+
+
+async def send_json(
+    send: Send,
+    status_code: int,
+    body: bytes,
+    headers: Iterable[tuple[bytes, bytes]] = (),
+) -> None:
+    """
+    Send a pre-encoded JSON response directly through the ASGI `send` callable.
+
+    Used by pure ASGI middleware to short-circuit a request without building
+    a Starlette `Response` object.
+
+    Args:
+        send (Send): ASGI send callable.
+        status_code (int): HTTP status code of the response.
+        body (bytes): Already encoded JSON body.
+        headers (Iterable[tuple[bytes, bytes]]): Extra raw response headers.
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
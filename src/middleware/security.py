@@ -1,40 +1,67 @@
-from fastapi import Request
-from fastapi.responses import JSONResponse
+import orjson
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
 from src.config.settings import settings
 from src.core.logger import logger
+from src.middleware.responses import send_json
 
-DENIED_ORIGINS = settings.DENIED_ORIGINS
-DENIED_USER_AGENTS = settings.DENIED_USER_AGENTS
+DENIED_ORIGINS = settings.denied_origins_set
+DENIED_UA_AUTOMATON = settings.denied_ua_automaton
+UNFILTERED_PATHS = frozenset({"/api/healthchecker"})
 
+FORBIDDEN_BODY = orjson.dumps({"detail": "Доступ заборонено"})
 
-async def block_denied_requests(request: Request, call_next):
-    """
-    Middleware to block requests from denied origins or user agents.
 
-    Checks the request headers for 'origin' and 'user-agent'.
-    If the origin is in the denied origins list or the user-agent matches any denied user agents,
-    the request is blocked with a 403 Forbidden response.
+def is_denied_user_agent(user_agent: str) -> bool:
+    """
+    Check whether a lower-cased user-agent contains any denied substring.
 
     Args:
-        request (Request): Incoming HTTP request.
-        call_next (Callable): Function to call the next middleware or route handler.
+        user_agent (str): Lower-cased user-agent header value.
 
     Returns:
-        JSONResponse: 403 response if request is blocked; otherwise, the response from the next handler.
+        bool: True if the user-agent matches a denied pattern.
+    """
+    if DENIED_UA_AUTOMATON is None:
+        return False
+    return next(DENIED_UA_AUTOMATON.iter(user_agent), None) is not None
+
+
+class DenyASGI:
+    """
+    Pure ASGI middleware to block requests from denied origins or user agents.
+
+    Checks the raw request headers for 'origin' and 'user-agent'; internal
+    health-check paths skip the header scan entirely.
+    If the origin is in the denied origins set or the user-agent contains any denied user agent (case-insensitive),
+    the request is blocked with a 403 Forbidden response.
+
+    Args:
+        app (ASGIApp): The wrapped ASGI application.
 
     Logs any unexpected errors during request processing.
     """
-    origin = request.headers.get("origin")
-    user_agent = request.headers.get("user-agent", "")
-    if origin in DENIED_ORIGINS or any(
-        bad_ua in user_agent for bad_ua in DENIED_USER_AGENTS
-    ):
-        return JSONResponse(
-            status_code=403,
-            content={"detail": "Доступ заборонено"},
-        )
-    try:
-        return await call_next(request)
-    except Exception as e:
-        logger.error(f"Error in middleware: {e}")
-        raise e
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in UNFILTERED_PATHS:
+            return await self.app(scope, receive, send)
+
+        origin = None
+        user_agent = ""
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value.decode("latin-1")
+            elif name == b"user-agent":
+                user_agent = value.decode("latin-1").lower()
+
+        if origin in DENIED_ORIGINS or is_denied_user_agent(user_agent):
+            return await send_json(send, 403, FORBIDDEN_BODY)
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            logger.error(f"Error in middleware: {e}")
+            raise e
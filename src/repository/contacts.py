@@ -1,11 +1,45 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
 from src.schemas import ContactCreate, ContactUpdate
 
+_SEL_CONTACTS = (
+    select(Contact)
+    .where(Contact.user_id == bindparam("uid"))
+    .order_by(Contact.id)
+    .offset(bindparam("off"))
+    .limit(bindparam("lim"))
+)
+_SEL_CONTACTS_AFTER = (
+    select(Contact)
+    .where(Contact.user_id == bindparam("uid"), Contact.id > bindparam("after"))
+    .order_by(Contact.id)
+    .limit(bindparam("lim"))
+)
+_SEL_CONTACT_BY_EMAIL = select(Contact).where(
+    Contact.email == bindparam("email"), Contact.user_id == bindparam("uid")
+)
+_SEL_CONTACT_ID_BY_EMAIL = (
+    select(Contact.id)
+    .where(Contact.email == bindparam("email"), Contact.user_id == bindparam("uid"))
+    .limit(1)
+)
+_SEL_CONTACT_BY_ID = select(Contact).where(
+    Contact.id == bindparam("cid"), Contact.user_id == bindparam("uid")
+)
+_SEL_CONTACTS_BY_IDS = (
+    select(Contact)
+    .where(
+        Contact.user_id == bindparam("uid"),
+        Contact.id.in_(bindparam("ids", expanding=True)),
+    )
+    .execution_options(populate_existing=False)
+)
+
 
 class ContactRepository:
     """
@@ -33,27 +67,63 @@ class ContactRepository:
         """
         if email is None:
             return None
-        stmt = select(Contact).where(Contact.email == email, Contact.user_id == user.id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            _SEL_CONTACT_BY_EMAIL, {"email": email, "uid": user.id}
+        )
         contact = result.scalar_one_or_none()
         return contact
 
+    async def email_exists(self, email: str | None, user: User) -> int | None:
+        """
+        Check whether a user already has a contact with the given email.
+
+        Only the contact ID is selected, so no ORM object is hydrated.
+
+        Args:
+            email (str | None): Email to look up.
+            user (User): User who owns the contacts.
+
+        Returns:
+            int | None: ID of the contact using the email, or None.
+        """
+        if email is None:
+            return None
+        result = await self.session.execute(
+            _SEL_CONTACT_ID_BY_EMAIL, {"email": email, "uid": user.id}
+        )
+        return result.scalar()
+
     async def get_contacts(
-        self, user: User, skip: int = 0, limit: int = 10
+        self,
+        user: User,
+        skip: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
     ) -> List[Contact]:
         """
         Retrieve a list of contacts for a user with pagination.
 
+        Contacts are ordered by ID. When `after_id` is given, keyset pagination
+        (`id > after_id`) is used instead of OFFSET, so deep pages cost the same
+        as the first one.
+
         Args:
             user (User): User who owns the contacts.
             skip (int): Number of contacts to skip.
             limit (int): Maximum number of contacts to return.
+            after_id (int | None): Return only contacts with an ID greater than this.
 
         Returns:
             List[Contact]: List of contacts.
         """
-        stmt = select(Contact).filter_by(user_id=user.id).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
+        if after_id is not None:
+            result = await self.session.execute(
+                _SEL_CONTACTS_AFTER, {"uid": user.id, "after": after_id, "lim": limit}
+            )
+        else:
+            result = await self.session.execute(
+                _SEL_CONTACTS, {"uid": user.id, "off": skip, "lim": limit}
+            )
         contacts = list(result.scalars().all())
         return contacts
 
@@ -68,29 +138,60 @@ class ContactRepository:
         Returns:
             Optional[Contact]: Contact if found, else None.
         """
-        stmt = select(Contact).where(
-            Contact.id == contact_id, Contact.user_id == user.id
+        result = await self.session.execute(
+            _SEL_CONTACT_BY_ID, {"cid": contact_id, "uid": user.id}
         )
-        result = await self.session.execute(stmt)
         contact = result.scalar_one_or_none()
         return contact
 
+    async def get_contacts_by_ids(
+        self, ids: Sequence[int], user: User
+    ) -> Dict[int, Contact]:
+        """
+        Retrieve several contacts of a user with a single IN query.
+
+        Args:
+            ids (Sequence[int]): IDs of the contacts.
+            user (User): User who owns the contacts.
+
+        Returns:
+            Dict[int, Contact]: Found contacts keyed by ID; missing IDs are absent.
+        """
+        if not ids:
+            return {}
+        result = await self.session.execute(
+            _SEL_CONTACTS_BY_IDS, {"uid": user.id, "ids": list(ids)}
+        )
+        return {contact.id: contact for contact in result.scalars().all()}
+
     async def create_contact(self, contact: ContactCreate, user: User) -> Contact:
         """
         Create a new contact for a user.
 
+        Runs a single INSERT ... RETURNING statement instead of add, flush and refresh.
+
         Args:
             contact (ContactCreate): Contact data to create.
             user (User): User who owns the new contact.
 
+        Raises:
+            IntegrityError: If the email is already used by another contact of the user.
+
         Returns:
             Contact: Created contact object.
         """
-        new_contact = Contact(**contact.model_dump(), user_id=user.id)
-        self.session.add(new_contact)
+        stmt = (
+            insert(Contact)
+            .values(**contact.model_dump(), user_id=user.id)
+            .returning(Contact)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
-        await self.session.refresh(new_contact)
-        return new_contact
+        return result.scalar_one()
 
     async def update_contact(
         self, contact_id: int, contact_data: ContactUpdate, user: User
@@ -98,27 +199,43 @@ class ContactRepository:
         """
         Update an existing contact's details.
 
+        Runs a single UPDATE ... RETURNING statement scoped to the owner, so
+        no prior SELECT or refresh is needed.
+
         Args:
             contact_id (int): ID of the contact to update.
             contact_data (ContactUpdate): Updated contact data.
             user (User): User who owns the contact.
 
+        Raises:
+            IntegrityError: If the new email is already used by another contact of the user.
+
         Returns:
             Optional[Contact]: Updated contact if found, else None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact is None:
-            return None
-        for field, value in contact_data.model_dump(exclude_unset=True).items():
-            setattr(contact, field, value)
+        values = contact_data.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_contact_by_id(contact_id, user)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**values)
+            .returning(Contact)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
-        await self.session.refresh(contact)
-        return contact
+        return result.scalar_one_or_none()
 
     async def delete_contact(self, contact_id: int, user: User) -> bool:
         """
         Delete a contact by ID for a specific user.
 
+        Runs a single DELETE ... RETURNING statement scoped to the owner.
+
         Args:
             contact_id (int): ID of the contact to delete.
             user (User): User who owns the contact.
@@ -126,9 +243,11 @@ class ContactRepository:
         Returns:
             bool: True if deleted successfully, False if not found.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact is None:
-            return False
-        await self.session.delete(contact)
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact.id)
+        )
+        result = await self.session.execute(stmt)
         await self.session.commit()
-        return True
+        return result.scalar_one_or_none() is not None
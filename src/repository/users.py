@@ -1,14 +1,32 @@
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
-from src.schemas import UserCreate
+from src.schemas import UserCreate, UserRole
+
+_SEL_USER_BY_ID = select(User).where(User.id == bindparam("uid"))
+_SEL_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_SEL_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"))
+_SEL_USER_BY_EMAIL_OR_USERNAME = (
+    select(User)
+    .where(
+        or_(
+            func.lower(User.email) == bindparam("email"),
+            User.username == bindparam("username"),
+        )
+    )
+    .limit(1)
+)
 
 
 class UserRepository:
     """
     Repository for user-related database operations.
 
+    Users found by username or email are memoized in `session.info`, so repeated
+    lookups within the same session (one per request via `get_db`) hit the
+    database only once. The memo is cleared on every write.
+
     Args:
         session (AsyncSession): Async SQLAlchemy session instance.
     """
@@ -16,6 +34,19 @@ class UserRepository:
     def __init__(self, session: AsyncSession):
         self.db = session
 
+    @property
+    def _user_cache(self) -> dict:
+        return self.db.info.setdefault("user_cache", {})
+
+    def _remember(self, user: User | None) -> User | None:
+        if user is not None:
+            self._user_cache[("username", user.username)] = user
+            self._user_cache[("email", user.email.lower())] = user
+        return user
+
+    def _forget(self) -> None:
+        self._user_cache.clear()
+
     async def get_user_by_id(self, user_id: int) -> User | None:
         """
         Retrieve a user by their ID.
@@ -26,8 +57,7 @@ class UserRepository:
         Returns:
             User | None: The user object if found, else None.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_SEL_USER_BY_ID, {"uid": user_id})
         return user.scalar_one_or_none()
 
     async def get_user_by_username(self, username: str) -> User | None:
@@ -40,13 +70,18 @@ class UserRepository:
         Returns:
             User | None: The user object if found, else None.
         """
-        stmt = select(User).filter_by(username=username)
-        user = await self.db.execute(stmt)
-        return user.scalar_one_or_none()
+        cached = self._user_cache.get(("username", username))
+        if cached is not None:
+            return cached
+        user = await self.db.execute(_SEL_USER_BY_USERNAME, {"username": username})
+        return self._remember(user.scalar_one_or_none())
 
     async def get_user_by_email(self, email: str) -> User | None:
         """
-        Retrieve a user by their email.
+        Retrieve a user by their email, ignoring case.
+
+        The comparison uses LOWER(email) so it is served by the unique functional
+        index ix_users_email_lower, which allows at most one matching row.
 
         Args:
             email (str): The email address of the user.
@@ -54,32 +89,57 @@ class UserRepository:
         Returns:
             User | None: The user object if found, else None.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        cached = self._user_cache.get(("email", email.lower()))
+        if cached is not None:
+            return cached
+        user = await self.db.execute(_SEL_USER_BY_EMAIL, {"email": email.lower()})
+        return self._remember(user.scalar_one_or_none())
+
+    async def get_user_by_email_or_username(
+        self, email: str, username: str
+    ) -> User | None:
+        """
+        Retrieve a user matching either the email (ignoring case) or the username
+        in a single query.
+
+        Args:
+            email (str): The email address to look up.
+            username (str): The username to look up.
+
+        Returns:
+            User | None: The first matching user if found, else None.
+        """
+        user = await self.db.execute(
+            _SEL_USER_BY_EMAIL_OR_USERNAME,
+            {"email": email.lower(), "username": username},
+        )
         return user.scalar_one_or_none()
 
     async def create_user(
-        self, body: UserCreate, avatar: str | None, role: str
+        self, body: UserCreate, avatar: str | None, role: UserRole
     ) -> User:
         """
         Create a new user in the database.
 
+        The email is stored lowercased, matching the case-insensitive lookups.
+
         Args:
             body (UserCreate): Data for creating a user.
             avatar (str | None): URL of the user's avatar.
-            role (str): User role.
+            role (UserRole): User role.
 
         Returns:
             User: The created user object.
         """
         user = User(
             username=body.username,
-            email=body.email,
+            email=body.email.lower(),
             hashed_password=body.password,
             avatar=avatar,
             role=role,
         )
         self.db.add(user)
+        self._forget()
         await self.db.commit()
         await self.db.refresh(user)
         return user
@@ -94,8 +154,41 @@ class UserRepository:
         user = await self.get_user_by_email(email)
         if user:
             user.confirmed = True
+            self._forget()
             await self.db.commit()
 
+    async def update_refresh_token(self, user_id: int, refresh_token: str) -> None:
+        """
+        Store a new refresh token for a user with a single UPDATE statement.
+
+        Args:
+            user_id (int): The ID of the user.
+            refresh_token (str): The refresh token to store.
+        """
+        stmt = (
+            update(User).where(User.id == user_id).values(refresh_token=refresh_token)
+        )
+        await self.db.execute(stmt)
+        self._forget()
+        await self.db.commit()
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        """
+        Store a new password hash for a user with a single UPDATE statement.
+
+        Args:
+            user_id (int): The ID of the user.
+            hashed_password (str): The new hashed password.
+        """
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(hashed_password=hashed_password)
+        )
+        await self.db.execute(stmt)
+        self._forget()
+        await self.db.commit()
+
     async def update_avatar_url(self, user: User, url: str) -> User:
         """
         Update the avatar URL of a user.
@@ -108,6 +201,7 @@ class UserRepository:
             User: Updated user object.
         """
         user.avatar = url
+        self._forget()
         await self.db.commit()
         await self.db.refresh(user)
         return user
@@ -29,7 +29,7 @@ class UserCreate(BaseModel):
     username: str
     email: str
     password: str
-    role: Optional[str] = "user"
+    role: Optional[UserRole] = UserRole.user
 
 
 class Token(BaseModel):
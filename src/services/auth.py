@@ -1,28 +1,51 @@
-import json
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+
+import msgspec
+import orjson
 from datetime import datetime, timedelta, UTC
 from typing import Optional
-from types import SimpleNamespace
 
 from fastapi import Depends, HTTPException, status
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import (
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidTokenError as JWTError,
+)
 
 from src.database.db import get_db
 from src.database.models import User, UserRole
 from src.config.settings import settings
 from src.services.users import UserService
-from src.services.redis_cache import get_redis
+from src.services.redis_cache import SET_IF_GENERATION, get_redis
+from src.core.logger import logger
 
 
 class Hash:
     """
-    Provides methods to hash passwords and verify them using bcrypt.
+    Provides methods to hash passwords and verify them using argon2id.
+
+    bcrypt is kept as a deprecated scheme so existing hashes still verify
+    and can be upgraded on the next successful login.
     """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        argon2__time_cost=2,
+        argon2__memory_cost=19456,
+        argon2__parallelism=1,
+        deprecated="auto",
+    )
 
     def verify_password(self, plain_password, hashed_password) -> bool:
         """
@@ -49,10 +72,201 @@ class Hash:
         """
         return self.pwd_context.hash(password)
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check whether a stored hash uses a deprecated scheme or outdated parameters.
+
+        Args:
+            hashed_password (str): The stored password hash.
+
+        Returns:
+            bool: True if the password should be rehashed.
+        """
+        return self.pwd_context.needs_update(hashed_password)
+
+
+hasher = Hash()
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password in the default thread pool so hashing does not block the event loop.
+
+    Args:
+        password (str): The plaintext password to hash.
+
+    Returns:
+        str: The hashed password.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, hasher.get_password_hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the default thread pool so hashing does not block the event loop.
+
+    Args:
+        plain_password (str): The plaintext password to verify.
+        hashed_password (str): The hashed password to compare against.
+
+    Returns:
+        bool: True if the password matches, False otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, hasher.verify_password, plain_password, hashed_password
+    )
+
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+class CachedUser(msgspec.Struct, frozen=True):
+    """
+    Current user data as stored in the Redis cache.
+
+    Decoding straight into this struct with `msgspec.json` validates the payload
+    in C and yields a slotted object instead of a dict-backed namespace. Decoding
+    is lax, so entries written with a string id still load as an integer.
+    """
+
+    id: int
+    username: str
+    email: str
+    confirmed: bool
+    role: str
+    avatar: Optional[str] = None
+
+
+_cached_user_decoder = msgspec.json.Decoder(CachedUser, strict=False)
+_cached_user_encoder = msgspec.json.Encoder()
+
+
+USER_CACHE_TTL = 3600
+
+_pending_cache_writes: set[asyncio.Task] = set()
+
+
+def _on_cache_write_done(task: asyncio.Task) -> None:
+    _pending_cache_writes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Redis user cache write failed: {task.exception()}")
+
+
+def to_cached_user(user: User) -> CachedUser:
+    """
+    Build the cached representation of a user model.
+
+    Args:
+        user (User): User loaded from the database.
+
+    Returns:
+        CachedUser: Data to keep in Redis for the user.
+    """
+    return CachedUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        confirmed=user.confirmed,
+        role=user.role.value if isinstance(user.role, UserRole) else user.role,
+        avatar=user.avatar,
+    )
+
+
+def encode_cached_user(user: User) -> bytes:
+    """
+    Serialize a user model into the JSON bytes stored in Redis.
+
+    Args:
+        user (User): User loaded from the database.
+
+    Returns:
+        bytes: Encoded cache payload.
+    """
+    return _cached_user_encoder.encode(to_cached_user(user))
+
+
+_HMAC_CONTEXTS = {
+    secret: hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    for secret in (settings.JWT_SECRET, settings.JWT_REFRESH_SECRET)
+}
+
+
+def _b64url_decode(segment: str) -> bytes:
+    raw = base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+    # Only the canonical unpadded encoding is accepted, so one token has one spelling.
+    if base64.urlsafe_b64encode(raw).rstrip(b"=").decode() != segment:
+        raise binascii.Error("Non-canonical base64url segment")
+    return raw
+
+
+def _numeric_claim(payload: dict, name: str) -> int | float | None:
+    value = payload.get(name)
+    if value is not None and (
+        isinstance(value, bool) or not isinstance(value, (int, float))
+    ):
+        raise JWTError(f"The {name} claim must be a number")
+    return value
+
+
+def decode_token(token: str, secret: str) -> dict:
+    """
+    Verify and decode a JWT signed with the given secret.
+
+    For HS256 the signature is checked against a precomputed HMAC-SHA256
+    context and the payload is parsed with orjson, skipping PyJWT's
+    algorithm dispatch. Like `jwt.decode` it rejects expired tokens and tokens
+    whose `nbf` or `iat` lies in the future; segments must be canonical
+    unpadded base64url. Any other configured algorithm falls back to `jwt.decode`.
+
+    Args:
+        token (str): Encoded JWT.
+        secret (str): Secret key the token was signed with.
+
+    Raises:
+        JWTError: If the token is malformed, has an invalid signature, is expired
+            or is not yet valid.
+
+    Returns:
+        dict: Decoded token payload.
+    """
+    if settings.JWT_ALGORITHM != "HS256":
+        return jwt.decode(token, secret, algorithms=[settings.JWT_ALGORITHM])
+
+    try:
+        header_segment, payload_segment, signature_segment = token.split(".")
+        header = orjson.loads(_b64url_decode(header_segment))
+        signature = _b64url_decode(signature_segment)
+        payload = orjson.loads(_b64url_decode(payload_segment))
+    except (ValueError, binascii.Error):
+        raise JWTError("Malformed token")
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise JWTError("The specified alg value is not allowed")
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload")
+
+    base_mac = _HMAC_CONTEXTS.get(secret) or hmac.new(
+        secret.encode(), digestmod=hashlib.sha256
+    )
+    mac = base_mac.copy()
+    mac.update(f"{header_segment}.{payload_segment}".encode())
+    if not hmac.compare_digest(mac.digest(), signature):
+        raise JWTError("Signature verification failed")
+
+    now = time.time()
+    exp = _numeric_claim(payload, "exp")
+    if exp is not None and exp <= now:
+        raise ExpiredSignatureError("Signature has expired")
+    nbf = _numeric_claim(payload, "nbf")
+    if nbf is not None and nbf > now:
+        raise ImmatureSignatureError("The token is not yet valid (nbf)")
+    iat = _numeric_claim(payload, "iat")
+    if iat is not None and iat > now:
+        raise ImmatureSignatureError("The token is not yet valid (iat)")
+    return payload
+
+
 async def create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
     """
     Create a JWT access token with an optional expiration time.
@@ -108,12 +322,15 @@ async def create_refresh_token(data: dict, expires_delta: Optional[int] = None):
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-) -> SimpleNamespace:
+) -> CachedUser:
     """
     Retrieve the current user from the JWT token.
 
     Checks the token validity, tries to fetch cached user data from Redis,
-    otherwise queries the database.
+    otherwise queries the database. On a miss the cache is filled by a
+    background task, so the response does not wait for the Redis write. The
+    write is fenced by the user's cache generation: if `invalidate_cached_user`
+    ran after the lookup, the stale copy is not stored.
 
     Args:
         token (str): JWT token from the Authorization header.
@@ -123,7 +340,7 @@ async def get_current_user(
         HTTPException: If credentials are invalid or user not found.
 
     Returns:
-        SimpleNamespace: User data namespace with id, username, email, confirmed status, and role.
+        CachedUser: User data with id, username, email, confirmed status, avatar and role.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -132,9 +349,7 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_token(token, settings.JWT_SECRET)
         username = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -142,28 +357,53 @@ async def get_current_user(
         raise credentials_exception
 
     redis = await get_redis()
-    cached_user = await redis.get(f"user:{username}")
+    key = f"user:{username}"
+    generation_key = f"user_gen:{username}"
+    cached_user, generation = await redis.mget(key, generation_key)
 
     if cached_user:
-        user_data = json.loads(cached_user)
-        user_data["role"] = UserRole(user_data["role"])
-        return SimpleNamespace(**user_data)
+        return _cached_user_decoder.decode(cached_user)
 
     user_service = UserService(db)
     user = await user_service.get_user_by_username(username)
     if user is None:
         raise credentials_exception
 
-    user_data = {
-        "id": str(user.id),
-        "username": user.username,
-        "email": user.email,
-        "confirmed": user.confirmed,
-        "role": user.role.value if isinstance(user.role, UserRole) else user.role,
-    }
+    cached = to_cached_user(user)
+    task = asyncio.create_task(
+        redis.eval(
+            SET_IF_GENERATION,
+            2,
+            generation_key,
+            key,
+            generation or "0",
+            USER_CACHE_TTL,
+            _cached_user_encoder.encode(cached),
+        )
+    )
+    _pending_cache_writes.add(task)
+    task.add_done_callback(_on_cache_write_done)
+    return cached
+
 
-    await redis.set(f"user:{username}", json.dumps(user_data), ex=3600)
-    return SimpleNamespace(**user_data)
+async def invalidate_cached_user(username: str) -> None:
+    """
+    Remove the cached user data from Redis so the next request reloads it from the database.
+
+    The user's cache generation is bumped as well, so a request that loaded the
+    user before this call cannot write its stale copy back.
+
+    Args:
+        username (str): Username whose cache entry should be removed.
+    """
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.incr(f"user_gen:{username}")
+            pipe.delete(f"user:{username}")
+            await pipe.execute()
+    except Exception:
+        logger.exception(f"Redis cache invalidation failed for user {username}")
 
 
 def create_email_token(data: dict) -> str:
@@ -184,6 +424,27 @@ def create_email_token(data: dict) -> str:
     return token
 
 
+@lru_cache(maxsize=1024)
+def _email_token_for(email: str, minute_bucket: int) -> str:
+    return create_email_token({"sub": email})
+
+
+def get_email_token(email: str) -> str:
+    """
+    Get an email confirmation token, reusing one signed within the current minute.
+
+    Repeated confirmation resends for the same address hit the cache instead of
+    signing a new token; the minute bucket in the key makes entries age out.
+
+    Args:
+        email (str): Email address the token is issued for.
+
+    Returns:
+        str: The encoded JWT email token.
+    """
+    return _email_token_for(email, int(time.time() // 60))
+
+
 async def get_email_from_token(token: str) -> Optional[str]:
     """
     Extract email (subject) from a JWT token.
@@ -198,9 +459,7 @@ async def get_email_from_token(token: str) -> Optional[str]:
         Optional[str]: Extracted email if valid.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_token(token, settings.JWT_SECRET)
         email = payload.get("sub")
         return email
     except JWTError as e:
@@ -224,11 +483,7 @@ async def verify_refresh_token(
         Optional[User]: User object if token is valid and user exists, else None.
     """
     try:
-        payload = jwt.decode(
-            refresh_token,
-            settings.JWT_REFRESH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+        payload = decode_token(refresh_token, settings.JWT_REFRESH_SECRET)
         username = payload.get("sub")
         token_type = payload.get("token_type")
         if username is None or token_type != "refresh":
@@ -1,9 +1,29 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import re
+import time
+from functools import lru_cache
 import cloudinary
-from cloudinary.uploader import upload, destroy
-from cloudinary.utils import cloudinary_url
-from cloudinary.exceptions import Error as CloudinaryError
+import httpx
+from cloudinary.utils import cloudinary_url, api_sign_request
+
+from src.core.logger import logger
+
+UPLOAD_URL = "https://api.cloudinary.com/v1_1/{cloud_name}/image/upload"
+DESTROY_URL = "https://api.cloudinary.com/v1_1/{cloud_name}/image/destroy"
+RESOURCES_URL = "https://api.cloudinary.com/v1_1/{cloud_name}/resources/image/upload"
+DELIVERY_URL = "https://res.cloudinary.com/{cloud_name}/image/upload"
+DELETE_BATCH_SIZE = 100
+# Public IDs that cloudinary_url emits verbatim (no escaping, no version prefix).
+_PLAIN_PUBLIC_ID = re.compile(r"(?!v\d)[A-Za-z0-9_-]+(?:/[A-Za-z0-9_-]+)*")
+
+
+@lru_cache(maxsize=4096)
+def _build_url(
+    public_id: str, width: int, height: int, version: int | None = None
+) -> str:
+    url, _ = cloudinary_url(
+        public_id, width=width, height=height, crop="fill", version=version
+    )
+    return url
 
 
 class CloudinaryService:
@@ -15,16 +35,35 @@ class CloudinaryService:
         cloud_name (str): Cloudinary cloud name.
         api_key (str): Cloudinary API key.
         api_secret (str): Cloudinary API secret.
-        max_workers (int): Maximum number of worker threads for async execution.
+        max_connections (int): Maximum number of concurrent connections to the Cloudinary API.
     """
 
     def __init__(
-        self, cloud_name: str, api_key: str, api_secret: str, max_workers: int = 5
+        self,
+        cloud_name: str,
+        api_key: str,
+        api_secret: str,
+        max_connections: int = 100,
     ):
         cloudinary.config(
             cloud_name=cloud_name, api_key=api_key, api_secret=api_secret, secure=True
         )
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cloud_name = cloud_name
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self._base = DELIVERY_URL.format(cloud_name=cloud_name)
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=20
+            ),
+        )
+
+    def _signed_params(self, **params: str) -> dict:
+        params["timestamp"] = str(int(time.time()))
+        params["signature"] = api_sign_request(params, self.api_secret)
+        params["api_key"] = self.api_key
+        return params
 
     async def upload_file(
         self, file, public_id: str, width: int = 250, height: int = 250
@@ -32,8 +71,12 @@ class CloudinaryService:
         """
         Upload a file asynchronously to Cloudinary.
 
+        The file is sent as a signed multipart request over HTTP; httpx reads
+        the underlying file in 64 KiB chunks, so the whole image is never held in memory.
+
         Args:
-            file: File object to upload (expects an object with a .file attribute).
+            file: File object to upload (expects an UploadFile-like object with .file,
+                .filename and .content_type attributes).
             public_id (str): Public identifier to assign to the uploaded file.
             width (int, optional): Width for the resulting image URL (default 250).
             height (int, optional): Height for the resulting image URL (default 250).
@@ -44,30 +87,44 @@ class CloudinaryService:
         Raises:
             Exception: If Cloudinary upload fails.
         """
-
-        loop = asyncio.get_event_loop()
+        params = self._signed_params(
+            invalidate="true", overwrite="true", public_id=public_id
+        )
 
         try:
-            result = await loop.run_in_executor(
-                self.executor,
-                lambda: upload(file.file, public_id=public_id, overwrite=True),
+            response = await self.client.post(
+                UPLOAD_URL.format(cloud_name=self.cloud_name),
+                data=params,
+                files={"file": (file.filename, file.file, file.content_type)},
             )
+            response.raise_for_status()
+            result = response.json()
+        except httpx.HTTPError as e:
+            raise Exception(f"Помилка при завантаженні файлу в Cloudinary: {e}")
 
-            url, _ = cloudinary_url(
-                public_id,
-                width=width,
-                height=height,
-                crop="fill",
-                version=result.get("version"),
-            )
-            return url
+        return _build_url(public_id, width, height, result.get("version"))
 
-        except CloudinaryError as e:
-            raise Exception(f"Помилка при завантаженні файлу в Cloudinary: {e}")
+    async def upload_file_background(self, file, public_id: str) -> None:
+        """
+        Upload a file to Cloudinary from a background task.
+
+        Errors are logged instead of raised, since no client is waiting for the
+        result, and the file is closed once the upload finishes.
+
+        Args:
+            file: UploadFile-like object to upload.
+            public_id (str): Public identifier to assign to the uploaded file.
+        """
+        try:
+            await self.upload_file(file, public_id)
+        except Exception as e:
+            logger.error(f"Background avatar upload failed for {public_id}: {e}")
+        finally:
+            await file.close()
 
     async def delete_file(self, public_id: str) -> dict:
         """
-        Delete a file asynchronously from Cloudinary.
+        Delete a file asynchronously from Cloudinary with a signed destroy request.
 
         Args:
             public_id (str): Public identifier of the file to delete.
@@ -78,24 +135,62 @@ class CloudinaryService:
         Raises:
             Exception: If Cloudinary deletion fails.
         """
-
-        loop = asyncio.get_event_loop()
-
         try:
-            result = await loop.run_in_executor(
-                self.executor, lambda: destroy(public_id)
+            response = await self.client.post(
+                DESTROY_URL.format(cloud_name=self.cloud_name),
+                data=self._signed_params(public_id=public_id),
             )
-            return result
-
-        except CloudinaryError as e:
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
             raise Exception(f"Помилка при видаленні файлу з Cloudinary: {e}")
 
-    async def build_url(
-        self, public_id: str, width: int = 250, height: int = 250
-    ) -> str:
+    async def delete_files(self, public_ids: list[str]) -> dict:
+        """
+        Delete several files from Cloudinary using the Admin API batch endpoint.
+
+        Up to 100 public_ids are removed per request, so N files cost
+        ceil(N / 100) round-trips instead of N.
+
+        Args:
+            public_ids (list[str]): Public identifiers of the files to delete.
+
+        Returns:
+            dict: Mapping of public_id to deletion status as reported by Cloudinary.
+
+        Raises:
+            Exception: If Cloudinary deletion fails.
+        """
+        deleted = {}
+        url = RESOURCES_URL.format(cloud_name=self.cloud_name)
+        for start in range(0, len(public_ids), DELETE_BATCH_SIZE):
+            batch = public_ids[start : start + DELETE_BATCH_SIZE]
+            try:
+                response = await self.client.request(
+                    "DELETE",
+                    url,
+                    params=[("public_ids[]", public_id) for public_id in batch],
+                    auth=(self.api_key, self.api_secret),
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise Exception(f"Помилка при видаленні файлів з Cloudinary: {e}")
+            deleted.update(response.json().get("deleted", {}))
+        return deleted
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and its pooled connections.
+        """
+        await self.client.aclose()
+
+    def build_url(self, public_id: str, width: int = 250, height: int = 250) -> str:
         """
         Build a Cloudinary URL for a given public_id with specified transformations.
 
+        Plain public IDs are formatted directly against the precomputed delivery
+        base; anything needing escaping falls back to the memoized `cloudinary_url`.
+
         Args:
             public_id (str): Public identifier of the file.
             width (int, optional): Width for the image (default 250).
@@ -104,5 +199,7 @@ class CloudinaryService:
         Returns:
             str: URL string to access the file.
         """
-        url, _ = cloudinary_url(public_id, width=width, height=height, crop="fill")
-        return url
+        if _PLAIN_PUBLIC_ID.fullmatch(public_id):
+            version = "v1/" if "/" in public_id else ""
+            return f"{self._base}/c_fill,h_{height},w_{width}/{version}{public_id}"
+        return _build_url(public_id, width, height)
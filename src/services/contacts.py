@@ -1,14 +1,35 @@
+from hashlib import blake2b
 from typing import List
 from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 
-from src.schemas import ContactCreate, ContactUpdate
+from src.schemas import ContactCreate, ContactUpdate, ContactResponse
 from src.database.models import Contact, User
 from src.repository.contacts import ContactRepository
+from src.services.redis_cache import (
+    GET_WITH_GENERATION,
+    SET_IF_GENERATION,
+    get_redis,
+)
+from src.core.logger import logger
+
+CONTACT_CACHE_TTL = 60
+
+_contact_list_adapter = TypeAdapter(List[ContactResponse])
 
 
 class ContactService:
     """
     Service class to handle contact-related operations.
+
+    Single contacts and contact pages are cached in Redis for a short time
+    (read-through). Any write for a user bumps that user's cache generation and
+    drops the affected single-contact entry; pages are keyed by generation, so
+    the bump alone retires every cached page without scanning for them. A reader
+    that loaded data before the write finds the generation changed and does not
+    store its stale copy.
+    Redis errors are logged and the database is used instead.
     """
 
     def __init__(self, repository: ContactRepository):
@@ -20,9 +41,73 @@ class ContactService:
         """
         self.repository = repository
 
+    @staticmethod
+    def _generation_key(user: User) -> str:
+        return f"contacts_gen:{user.id}"
+
+    async def _cache_get(self, key: str, user: User) -> tuple[str | None, str | None]:
+        try:
+            redis = await get_redis()
+            cached, generation = await redis.mget(key, self._generation_key(user))
+            return cached, generation or "0"
+        except Exception as e:
+            logger.error(f"Redis contact cache read failed for {key}: {e}")
+            return None, None
+
+    async def _cache_get_page(
+        self, user: User, page: str
+    ) -> tuple[str | None, str | None]:
+        try:
+            redis = await get_redis()
+            generation, cached = await redis.eval(
+                GET_WITH_GENERATION,
+                1,
+                self._generation_key(user),
+                f"contacts:{user.id}:",
+                f":{page}",
+            )
+            return cached, generation
+        except Exception as e:
+            logger.error(f"Redis contact page cache read failed for {page}: {e}")
+            return None, None
+
+    async def _cache_set(
+        self, key: str, user: User, generation: str | None, value: bytes | str
+    ) -> None:
+        if generation is None:
+            return
+        try:
+            redis = await get_redis()
+            await redis.eval(
+                SET_IF_GENERATION,
+                2,
+                self._generation_key(user),
+                key,
+                generation,
+                CONTACT_CACHE_TTL,
+                value,
+            )
+        except Exception as e:
+            logger.error(f"Redis contact cache write failed for {key}: {e}")
+
+    async def _invalidate(self, user: User, contact_id: int | None = None) -> None:
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.incr(self._generation_key(user))
+                if contact_id is not None:
+                    pipe.delete(f"contact:{user.id}:{contact_id}")
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis contact cache invalidation failed: {e}")
+
     async def list_contacts(
-        self, user: User, skip: int = 0, limit: int = 10
-    ) -> List[Contact]:
+        self,
+        user: User,
+        skip: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
+    ) -> List[ContactResponse]:
         """
         Retrieve a list of contacts for a given user with pagination.
 
@@ -30,13 +115,57 @@ class ContactService:
             user (User): The owner of the contacts.
             skip (int, optional): Number of records to skip. Defaults to 0.
             limit (int, optional): Maximum number of records to return. Defaults to 10.
+            after_id (int | None, optional): Keyset cursor; only contacts with a greater ID are returned.
 
         Returns:
-            List[Contact]: List of Contact objects.
+            List[ContactResponse]: Validated contacts, served from Redis when cached.
         """
-        return await self.repository.get_contacts(user, skip=skip, limit=limit)
+        body, _ = await self.list_contacts_json(
+            user, skip=skip, limit=limit, after_id=after_id
+        )
+        return _contact_list_adapter.validate_json(body)
 
-    async def get_contact_by_id(self, contact_id: int, user: User) -> Contact:
+    async def list_contacts_json(
+        self,
+        user: User,
+        skip: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
+    ) -> tuple[bytes, str]:
+        """
+        Retrieve a serialized page of a user's contacts together with its ETag.
+
+        The page is read through the same Redis cache as `list_contacts`, so an
+        unchanged page is answered without touching the database. The ETag is a
+        BLAKE2b digest of the JSON body, which changes whenever the page does.
+
+        Args:
+            user (User): The owner of the contacts.
+            skip (int, optional): Number of records to skip. Defaults to 0.
+            limit (int, optional): Maximum number of records to return. Defaults to 10.
+            after_id (int | None, optional): Keyset cursor; only contacts with a greater ID are returned.
+
+        Returns:
+            tuple[bytes, str]: The JSON body and its quoted strong ETag.
+        """
+        page = f"{skip}:{limit}:{after_id}"
+        cached, generation = await self._cache_get_page(user, page)
+        if cached is not None:
+            body = cached.encode() if isinstance(cached, str) else cached
+        else:
+            contacts = _contact_list_adapter.validate_python(
+                await self.repository.get_contacts(
+                    user, skip=skip, limit=limit, after_id=after_id
+                ),
+                from_attributes=True,
+            )
+            body = _contact_list_adapter.dump_json(contacts)
+            await self._cache_set(
+                f"contacts:{user.id}:{generation}:{page}", user, generation, body
+            )
+        return body, f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+    async def get_contact_by_id(self, contact_id: int, user: User) -> ContactResponse:
         """
         Retrieve a specific contact by its ID for a given user.
 
@@ -48,17 +177,27 @@ class ContactService:
             HTTPException: If contact with given ID is not found.
 
         Returns:
-            Contact: The found contact object.
+            ContactResponse: The found contact, validated whether it came from Redis or the database.
         """
+        key = f"contact:{user.id}:{contact_id}"
+        cached, generation = await self._cache_get(key, user)
+        if cached is not None:
+            return ContactResponse.model_validate_json(cached)
         contact = await self.repository.get_contact_by_id(contact_id, user)
         if contact is None:
             raise HTTPException(status_code=404, detail="Contact not found")
-        return contact
+        response = ContactResponse.model_validate(contact)
+        await self._cache_set(key, user, generation, response.model_dump_json())
+        return response
 
     async def create_contact(self, contact_data: ContactCreate, user: User) -> Contact:
         """
         Create a new contact for the given user.
 
+        The email pre-check gives the common case a clear error without an INSERT;
+        a concurrent create that slips past it is caught by the per-user unique
+        index on (user_id, email) and reported the same way.
+
         Args:
             contact_data (ContactCreate): Data required to create a contact.
             user (User): The owner of the contact.
@@ -69,12 +208,14 @@ class ContactService:
         Returns:
             Contact: The newly created contact object.
         """
-        existing_contact = await self.repository.get_contact_by_email(
-            contact_data.email, user
-        )
-        if existing_contact:
+        if await self.repository.email_exists(contact_data.email, user):
             raise HTTPException(status_code=400, detail="Email already exists")
-        return await self.repository.create_contact(contact_data, user)
+        try:
+            contact = await self.repository.create_contact(contact_data, user)
+        except IntegrityError:
+            raise HTTPException(status_code=400, detail="Email already exists")
+        await self._invalidate(user)
+        return contact
 
     async def update_contact(
         self, contact_id: int, contact_data: ContactUpdate, user: User
@@ -82,6 +223,9 @@ class ContactService:
         """
         Update an existing contact identified by contact_id for a given user.
 
+        The update is a single statement; a duplicate email is detected through
+        the per-user unique index on (user_id, email) rather than a prior SELECT.
+
         Args:
             contact_id (int): ID of the contact to update.
             contact_data (ContactUpdate): Updated contact data.
@@ -93,15 +237,16 @@ class ContactService:
         Returns:
             Contact | None: Updated contact object if successful.
         """
-        contact = await self.repository.get_contact_by_id(contact_id, user)
+        try:
+            contact = await self.repository.update_contact(
+                contact_id, contact_data, user
+            )
+        except IntegrityError:
+            raise HTTPException(status_code=400, detail="Email already exists")
         if contact is None:
             raise HTTPException(status_code=404, detail="Contact not found")
-        existing_contact = await self.repository.get_contact_by_email(
-            contact_data.email, user
-        )
-        if existing_contact and existing_contact.id != contact_id:
-            raise HTTPException(status_code=400, detail="Email already exists")
-        return await self.repository.update_contact(contact_id, contact_data, user)
+        await self._invalidate(user, contact_id)
+        return contact
 
     async def delete_contact(self, contact_id: int, user: User) -> None:
         """
@@ -117,7 +262,6 @@ class ContactService:
         Returns:
             None
         """
-        contact = await self.repository.get_contact_by_id(contact_id, user)
-        if contact is None:
+        if not await self.repository.delete_contact(contact_id, user):
             raise HTTPException(status_code=404, detail="Contact not found")
-        await self.repository.delete_contact(contact_id, user)
+        await self._invalidate(user, contact_id)
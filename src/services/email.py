@@ -4,7 +4,7 @@ from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
 from pydantic import EmailStr
 
-from src.services.auth import create_email_token
+from src.services.auth import get_email_token
 from src.config.settings import settings
 from src.core.logger import logger
 
@@ -22,11 +22,19 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / "templates",
 )
 
+fm = FastMail(conf)
+_templates = fm.config.template_engine()
+VERIFY_TEMPLATE = _templates.get_template("verify_email.html")
+RESET_TEMPLATE = _templates.get_template("reset_password.html")
+
 
 async def send_email(email: EmailStr, username: str, host: str):
     """
     Send a verification email to the specified user email address.
 
+    The template is loaded once at import and rendered here, so the message
+    carries a ready HTML body.
+
     Args:
         email (EmailStr): Recipient's email address.
         username (str): Username of the recipient.
@@ -36,20 +44,17 @@ async def send_email(email: EmailStr, username: str, host: str):
         Logs an error if sending email fails due to connection issues.
     """
     try:
-        token_verification = create_email_token({"sub": email})
+        token_verification = get_email_token(email)
         message = MessageSchema(
             subject="Confirm your email",
             recipients=[email],
-            template_body={
-                "host": host,
-                "username": username,
-                "token": token_verification,
-            },
+            body=VERIFY_TEMPLATE.render(
+                host=host, username=username, token=token_verification
+            ),
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="verify_email.html")
+        await fm.send_message(message)
     except ConnectionErrors as err:
         logger.error(f"Email sending failed: {err}")
 
@@ -70,13 +75,9 @@ async def send_password_reset_email(email: str, username: str, reset_link: str):
         message = MessageSchema(
             subject="Reset password",
             recipients=[email],
-            template_body={
-                "username": username,
-                "reset_link": reset_link,
-            },
+            body=RESET_TEMPLATE.render(username=username, reset_link=reset_link),
             subtype=MessageType.html,
         )
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="reset_password.html")
+        await fm.send_message(message)
     except ConnectionErrors as err:
         logger.error(f"Email sending failed: {err}")
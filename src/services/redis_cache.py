@@ -1,16 +1,40 @@
-from redis.asyncio import Redis
+from redis.asyncio import ConnectionPool, Redis
+from redis.utils import HIREDIS_AVAILABLE
 import logging
 from src.config.settings import settings
 
 redis: Redis | None = None
 
+# EVAL script: KEYS = (generation key, entry key), ARGV = (generation, ttl, value).
+# Stores the entry only if the generation counter still has the value read before
+# loading it, i.e. no write invalidated the cache in between.
+SET_IF_GENERATION = """
+if (redis.call('GET', KEYS[1]) or '0') == ARGV[1] then
+    redis.call('SETEX', KEYS[2], ARGV[2], ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# EVAL script: KEYS = (generation key,), ARGV = (entry key prefix, entry key suffix).
+# Reads the generation counter and the entry stored under that generation, i.e. at
+# prefix .. generation .. suffix, in one round trip. Entries of older generations are
+# never read again and simply expire.
+GET_WITH_GENERATION = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+return {generation, redis.call('GET', ARGV[1] .. generation .. ARGV[2])}
+"""
+
 
 async def get_redis() -> Redis:
     """
     Get a singleton Redis client instance.
 
     This function initializes and returns an asynchronous Redis client.
-    It creates a connection on the first call and reuses it on subsequent calls.
+    On the first call it creates an explicitly sized connection pool with TCP
+    keepalive and periodic health checks, and reuses it on subsequent calls.
+    Connections speak RESP3; when the `hiredis` package is installed, redis-py
+    uses its C parser automatically, and the selected parser is logged.
 
     Returns:
         Redis: An instance of an asynchronous Redis client.
@@ -18,9 +42,30 @@ async def get_redis() -> Redis:
     global redis
     if not redis:
         logging.info(f"Connecting to Redis at {settings.REDIS_URL}")
-        redis = Redis.from_url(
+        pool = ConnectionPool.from_url(
             settings.REDIS_URL,
             encoding="utf-8",
             decode_responses=True,
+            max_connections=settings.REDIS_POOL_SIZE,
+            socket_keepalive=True,
+            health_check_interval=30,
+            protocol=3,
+        )
+        logging.info(
+            "Redis parser: %s", "hiredis" if HIREDIS_AVAILABLE else "pure Python"
         )
+        redis = Redis(connection_pool=pool)
     return redis
+
+
+async def close_redis() -> None:
+    """
+    Close the Redis client and disconnect its connection pool.
+
+    Called from the application lifespan on shutdown.
+    """
+    global redis
+    if redis is not None:
+        await redis.aclose()
+        await redis.connection_pool.disconnect()
+        redis = None
@@ -1,10 +1,29 @@
+import hashlib
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
 from src.repository.users import UserRepository
-from src.schemas import UserCreate
-from src.core.logger import logger
+from src.schemas import UserCreate, UserRole
+
+GRAVATAR_URL = "https://www.gravatar.com/avatar/{}"
+
+
+def gravatar_url(email: str) -> str:
+    """
+    Build the Gravatar image URL for an email address.
+
+    Produces the same URL as `libgravatar.Gravatar(email).get_image()`
+    without any network access.
+
+    Args:
+        email (str): User's email address.
+
+    Returns:
+        str: Gravatar image URL.
+    """
+    email_hash = hashlib.md5(email.strip().lower().encode()).hexdigest()
+    return GRAVATAR_URL.format(email_hash)
 
 
 class UserService:
@@ -31,14 +50,8 @@ class UserService:
         Returns:
             User: The created user object.
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            logger.error(f"Failed to get gravatar image: {e}")
-
-        role = body.role if body.role else "user"
+        avatar = gravatar_url(body.email)
+        role = body.role if body.role else UserRole.user
 
         return await self.repository.create_user(body, avatar, role)
 
@@ -78,6 +91,19 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
+    async def get_user_by_email_or_username(self, email: str, username: str):
+        """
+        Retrieve a user matching either the email or the username.
+
+        Args:
+            email (str): Email address.
+            username (str): Username string.
+
+        Returns:
+            User | None: User object if found, else None.
+        """
+        return await self.repository.get_user_by_email_or_username(email, username)
+
     async def confirmed_email(self, email: str):
         """
         Mark user's email as confirmed.
@@ -90,6 +116,32 @@ class UserService:
         """
         return await self.repository.confirmed_email(email)
 
+    async def update_refresh_token(self, user_id: int, refresh_token: str):
+        """
+        Store a new refresh token for a user.
+
+        Args:
+            user_id (int): User's unique identifier.
+            refresh_token (str): The refresh token to store.
+
+        Returns:
+            None
+        """
+        return await self.repository.update_refresh_token(user_id, refresh_token)
+
+    async def update_password(self, user_id: int, hashed_password: str):
+        """
+        Store a new password hash for a user.
+
+        Args:
+            user_id (int): User's unique identifier.
+            hashed_password (str): The new hashed password.
+
+        Returns:
+            None
+        """
+        return await self.repository.update_password(user_id, hashed_password)
+
     async def update_avatar_url(self, email: str, url: str):
         """
         Update the avatar URL of a user by email.
@@ -1,17 +1,42 @@
+import asyncio
+import logging
 import pytest
 from datetime import date
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
-from main import app
 from src.database.models import User, Contact
 from src.schemas import ContactCreate
 
 
+def pytest_asyncio_loop_factories(config, item):
+    """Запускає асинхронні тести на uvloop, якщо він встановлений."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def log_level():
+    """Один раз виставляє рівень кореневого логера на ERROR для всієї сесії."""
+    root = logging.getLogger()
+    previous = root.level
+    root.setLevel(logging.ERROR)
+    yield
+    root.setLevel(previous)
+
+
 @pytest.fixture
 def fake_session():
     """Мок для асинхронної сесії SQLAlchemy."""
-    return AsyncMock()
+    session = AsyncMock()
+    session.info = {}
+    session.add = MagicMock()
+    return session
 
 
 @pytest.fixture
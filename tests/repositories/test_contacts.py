@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import IntegrityError
 
 from src.schemas import ContactUpdate
 from src.repository.contacts import ContactRepository
@@ -17,6 +18,20 @@ async def test_get_contact_by_email(fake_session, fake_user, fake_contact):
     assert result == fake_contact
 
 
+@pytest.mark.asyncio
+async def test_email_exists(fake_session, fake_user, fake_contact):
+    mock_result = MagicMock()
+    mock_result.scalar.return_value = fake_contact.id
+    fake_session.execute = AsyncMock(return_value=mock_result)
+    repo = ContactRepository(fake_session)
+
+    result = await repo.email_exists("john@example.com", fake_user)
+
+    assert result == fake_contact.id
+    stmt = fake_session.execute.call_args[0][0]
+    assert str(stmt).startswith("SELECT contacts.id \nFROM contacts")
+
+
 @pytest.mark.asyncio
 async def test_get_contacts(fake_session, fake_user, fake_contact):
     mock_result = MagicMock()
@@ -30,6 +45,21 @@ async def test_get_contacts(fake_session, fake_user, fake_contact):
     assert results[0] == fake_contact
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_after_id(fake_session, fake_user, fake_contact):
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [fake_contact]
+    fake_session.execute = AsyncMock(return_value=mock_result)
+    repo = ContactRepository(fake_session)
+
+    results = await repo.get_contacts(fake_user, limit=5, after_id=0)
+
+    stmt, params = fake_session.execute.call_args[0]
+    assert "OFFSET" not in str(stmt)
+    assert params == {"uid": fake_user.id, "after": 0, "lim": 5}
+    assert results == [fake_contact]
+
+
 @pytest.mark.asyncio
 async def test_get_contact_by_id(fake_session, fake_user, fake_contact):
     mock_result = MagicMock()
@@ -43,25 +73,47 @@ async def test_get_contact_by_id(fake_session, fake_user, fake_contact):
 
 
 @pytest.mark.asyncio
-async def test_create_contact(fake_session, fake_user, fake_contact_data):
-    fake_session.refresh = AsyncMock()
+async def test_get_contacts_by_ids(fake_session, fake_user, fake_contact):
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [fake_contact]
+    fake_session.execute = AsyncMock(return_value=mock_result)
+    repo = ContactRepository(fake_session)
+
+    result = await repo.get_contacts_by_ids([fake_contact.id, 42], fake_user)
+
+    assert result == {fake_contact.id: fake_contact}
+    fake_session.execute.assert_called_once()
+    assert fake_session.execute.call_args[0][1] == {
+        "uid": fake_user.id,
+        "ids": [fake_contact.id, 42],
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_contact(fake_session, fake_user, fake_contact, fake_contact_data):
+    mock_result = MagicMock()
+    mock_result.scalar_one.return_value = fake_contact
+    fake_session.execute = AsyncMock(return_value=mock_result)
     fake_session.commit = AsyncMock()
-    fake_session.add = AsyncMock()
+    fake_session.refresh = AsyncMock()
 
     repo = ContactRepository(fake_session)
 
     result = await repo.create_contact(fake_contact_data, fake_user)
 
-    fake_session.add.assert_called_once()
+    stmt = fake_session.execute.call_args[0][0]
+    assert str(stmt).startswith("INSERT INTO contacts")
+    assert stmt.compile().params["user_id"] == fake_user.id
+    assert stmt.compile().params["first_name"] == fake_contact_data.first_name
     fake_session.commit.assert_called_once()
-    fake_session.refresh.assert_called_once()
-    assert result.user_id == fake_user.id
-    assert result.first_name == fake_contact_data.first_name
+    fake_session.refresh.assert_not_called()
+    assert result == fake_contact
 
 
 @pytest.mark.asyncio
 async def test_update_contact(fake_session, fake_user, fake_contact):
     contact_data = ContactUpdate(first_name="Jane")
+    fake_contact.first_name = "Jane"
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = fake_contact
@@ -76,14 +128,62 @@ async def test_update_contact(fake_session, fake_user, fake_contact):
 
     assert updated is not None, "updated is None"
     assert updated.first_name == "Jane"
+    fake_session.execute.assert_called_once()
+    stmt = fake_session.execute.call_args[0][0]
+    assert str(stmt).startswith("UPDATE contacts")
+    assert "RETURNING" in str(stmt)
     fake_session.commit.assert_called_once()
-    fake_session.refresh.assert_called_once()
+    fake_session.refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_contact_not_found(fake_session, fake_user):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = None
+    fake_session.execute = AsyncMock(return_value=mock_result)
+
+    repo = ContactRepository(fake_session)
+
+    updated = await repo.update_contact(1, ContactUpdate(first_name="Jane"), fake_user)
+
+    assert updated is None
+
+
+@pytest.mark.asyncio
+async def test_update_contact_duplicate_email_rolls_back(fake_session, fake_user):
+    fake_session.execute = AsyncMock(
+        side_effect=IntegrityError("UPDATE contacts", {}, Exception("duplicate"))
+    )
+    repo = ContactRepository(fake_session)
+
+    with pytest.raises(IntegrityError):
+        await repo.update_contact(1, ContactUpdate(email="dup@example.com"), fake_user)
+
+    fake_session.rollback.assert_awaited_once()
+    fake_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_contact_duplicate_email_rolls_back(
+    fake_session, fake_user, fake_contact_data
+):
+    fake_session.execute = AsyncMock(
+        side_effect=IntegrityError("INSERT INTO contacts", {}, Exception("duplicate"))
+    )
+    repo = ContactRepository(fake_session)
+
+    with pytest.raises(IntegrityError):
+        await repo.create_contact(fake_contact_data, fake_user)
+
+    fake_session.rollback.assert_awaited_once()
+    fake_session.commit.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_delete_contact(fake_session, fake_user, fake_contact):
-    fake_session.execute.return_value.scalar_one_or_none.return_value = fake_contact
-    fake_session.delete = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = fake_contact.id
+    fake_session.execute = AsyncMock(return_value=mock_result)
     fake_session.commit = AsyncMock()
 
     repo = ContactRepository(fake_session)
@@ -91,5 +191,18 @@ async def test_delete_contact(fake_session, fake_user, fake_contact):
     result = await repo.delete_contact(fake_contact.id, fake_user)
 
     assert result is True
-    fake_session.delete.assert_called_once()
+    stmt = fake_session.execute.call_args[0][0]
+    assert str(stmt).startswith("DELETE FROM contacts")
+    fake_session.delete.assert_not_called()
     fake_session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_contact_not_found(fake_session, fake_user):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = None
+    fake_session.execute = AsyncMock(return_value=mock_result)
+
+    repo = ContactRepository(fake_session)
+
+    assert await repo.delete_contact(1, fake_user) is False
@@ -32,21 +32,67 @@ async def test_get_user_by_username(user_repo, fake_session, fake_user):
     assert result == fake_user
 
 
+@pytest.mark.asyncio
+async def test_get_user_by_username_memoized(user_repo, fake_session, fake_user):
+    stmt_result = MagicMock()
+    stmt_result.scalar_one_or_none.return_value = fake_user
+    fake_session.execute.return_value = stmt_result
+
+    await user_repo.get_user_by_username("testuser")
+    result = await UserRepository(fake_session).get_user_by_email(fake_user.email)
+
+    assert result == fake_user
+    fake_session.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_user_memo_cleared_on_write(user_repo, fake_session, fake_user):
+    stmt_result = MagicMock()
+    stmt_result.scalar_one_or_none.return_value = fake_user
+    fake_session.execute.return_value = stmt_result
+
+    await user_repo.get_user_by_username("testuser")
+    await user_repo.update_password(fake_user.id, "new_hash")
+    await user_repo.get_user_by_username("testuser")
+
+    assert fake_session.execute.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email(user_repo, fake_session, fake_user):
     stmt_result = MagicMock()
     stmt_result.scalar_one_or_none.return_value = fake_user
     fake_session.execute.return_value = stmt_result
 
-    result = await user_repo.get_user_by_email("test@example.com")
+    result = await user_repo.get_user_by_email("Test@Example.com")
 
     assert result == fake_user
+    stmt, params = fake_session.execute.call_args[0]
+    assert "lower(users.email)" in str(stmt)
+    assert params == {"email": "test@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_or_username(user_repo, fake_session, fake_user):
+    stmt_result = MagicMock()
+    stmt_result.scalar_one_or_none.return_value = fake_user
+    fake_session.execute.return_value = stmt_result
+
+    result = await user_repo.get_user_by_email_or_username(
+        "Test@Example.com", "testuser"
+    )
+
+    assert result == fake_user
+    fake_session.execute.assert_awaited_once()
+    stmt, params = fake_session.execute.call_args[0]
+    assert "lower(users.email)" in str(stmt)
+    assert params == {"email": "test@example.com", "username": "testuser"}
 
 
 @pytest.mark.asyncio
 async def test_create_user(user_repo, fake_session):
     user_create = UserCreate(
-        username="newuser", email="new@example.com", password="hashed_pass"
+        username="newuser", email="New@Example.com", password="hashed_pass"
     )
     fake_session.commit.reset_mock()
     fake_session.refresh.reset_mock()
@@ -60,6 +106,7 @@ async def test_create_user(user_repo, fake_session):
     fake_session.commit.assert_awaited_once()
     fake_session.refresh.assert_awaited_once()
     assert result.username == user_create.username
+    assert result.email == "new@example.com"
 
 
 @pytest.mark.asyncio
@@ -72,6 +119,24 @@ async def test_confirmed_email(user_repo, fake_session, fake_user):
     fake_session.commit.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_update_refresh_token(user_repo, fake_session):
+    await user_repo.update_refresh_token(1, "new_refresh_token")
+
+    fake_session.execute.assert_awaited_once()
+    fake_session.commit.assert_awaited_once()
+    fake_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_password(user_repo, fake_session):
+    await user_repo.update_password(1, "new_hashed_pass")
+
+    fake_session.execute.assert_awaited_once()
+    fake_session.commit.assert_awaited_once()
+    fake_session.refresh.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_update_avatar_url(user_repo, fake_session, fake_user):
     new_url = "http://new.avatar.com"
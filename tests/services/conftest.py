@@ -0,0 +1,59 @@
+import pytest
+
+from src.services import redis_cache
+from src.services.redis_cache import SET_IF_GENERATION
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_client():
+    """Скидає глобальний клієнт Redis до і після кожного тесту."""
+    redis_cache.redis = None
+    yield
+    redis_cache.redis = None
+
+
+class GenerationRedis:
+    """Redis у пам'яті, що відтворює скрипти кешу з перевіркою покоління."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def eval(self, script, numkeys, gen_key, *args):
+        current = self.data.get(gen_key, "0")
+        if script == SET_IF_GENERATION:
+            key, generation, ttl, value = args
+            if current == generation:
+                self.data[key] = value
+            return
+        prefix, suffix = args
+        return [current, self.data.get(f"{prefix}{current}{suffix}")]
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def incr(self, key):
+                redis.data[key] = str(int(redis.data.get(key, "0")) + 1)
+
+            def delete(self, key):
+                redis.data.pop(key, None)
+
+            async def execute(self):
+                pass
+
+        return Pipe()
+
+
+@pytest.fixture
+def generation_redis():
+    """Redis у пам'яті для тестів гонок між читанням і інвалідацією кешу."""
+    return GenerationRedis()
@@ -1,9 +1,10 @@
+import asyncio
 import pytest
 import json
-from jose import jwt, JWTError
+import jwt
+from jwt.exceptions import InvalidTokenError as JWTError
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch, MagicMock
-from types import SimpleNamespace
 from fastapi import HTTPException
 
 from src.config.settings import settings
@@ -12,11 +13,21 @@ from src.services.auth import (
     get_current_user,
     create_access_token,
     Hash,
+    hash_password,
+    verify_password,
     create_refresh_token,
     create_email_token,
     get_email_from_token,
     verify_refresh_token,
+    invalidate_cached_user,
+    decode_token,
+    CachedUser,
+    get_email_token,
+    USER_CACHE_TTL,
 )
+from src.services.redis_cache import SET_IF_GENERATION
+
+pytestmark = pytest.mark.auth
 
 
 def test_password_hash_and_verify():
@@ -28,6 +39,23 @@ def test_password_hash_and_verify():
     assert not hash_util.verify_password("wrongpass", hashed)
 
 
+def test_legacy_bcrypt_hash_verifies_and_needs_rehash():
+    hash_util = Hash()
+    legacy = hash_util.pwd_context.hash("supersecret", scheme="bcrypt")
+    assert hash_util.verify_password("supersecret", legacy)
+    assert hash_util.needs_rehash(legacy)
+    assert not hash_util.needs_rehash(hash_util.get_password_hash("supersecret"))
+
+
+@pytest.mark.asyncio
+async def test_hash_password_and_verify_async():
+    password = "supersecret"
+    hashed = await hash_password(password)
+    assert hashed != password
+    assert await verify_password(password, hashed)
+    assert not await verify_password("wrongpass", hashed)
+
+
 @pytest.mark.asyncio
 async def test_create_access_token_defaults():
     data = {"sub": "user1"}
@@ -77,10 +105,73 @@ async def test_create_refresh_token_custom_expiration():
     assert (exp - datetime.now()) <= timedelta(minutes=5)
 
 
+@pytest.mark.asyncio
+async def test_decode_token_valid():
+    token = await create_access_token({"sub": "user1"})
+    payload = decode_token(token, settings.JWT_SECRET)
+    assert payload["sub"] == "user1"
+    assert "exp" in payload
+
+
+@pytest.mark.asyncio
+async def test_decode_token_bad_signature():
+    token = await create_access_token({"sub": "user1"})
+    with pytest.raises(JWTError):
+        decode_token(token, "other_secret")
+
+
+@pytest.mark.asyncio
+async def test_decode_token_expired():
+    token = jwt.encode(
+        {"sub": "user1", "exp": int(datetime.now().timestamp()) - 60},
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+    with pytest.raises(JWTError):
+        decode_token(token, settings.JWT_SECRET)
+
+
+def test_decode_token_rejects_other_algorithm():
+    token = jwt.encode({"sub": "user1"}, settings.JWT_SECRET, algorithm="HS512")
+    with pytest.raises(JWTError):
+        decode_token(token, settings.JWT_SECRET)
+
+
+@pytest.mark.parametrize("claim", ["nbf", "iat"])
+def test_decode_token_not_yet_valid(claim):
+    token = jwt.encode(
+        {"sub": "user1", claim: int(datetime.now().timestamp()) + 60},
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+    with pytest.raises(JWTError):
+        decode_token(token, settings.JWT_SECRET)
+
+
+@pytest.mark.asyncio
+async def test_decode_token_rejects_reencoded_segments():
+    token = await create_access_token({"sub": "user1"})
+    header, payload, signature = token.split(".")
+
+    for tampered in (
+        f"{header}.{payload}.{signature}=",
+        f"{header}.{payload}==.{signature}",
+        f"{header}.{payload}.{signature[:-1]}{chr(ord(signature[-1]) ^ 1)}",
+        f"{header}.{payload}.{signature[:10]}*{signature[10:]}",
+    ):
+        with pytest.raises(JWTError):
+            decode_token(tampered, settings.JWT_SECRET)
+
+
+def test_decode_token_malformed():
+    with pytest.raises(JWTError):
+        decode_token("not-a-token", settings.JWT_SECRET)
+
+
 @pytest.mark.asyncio
 @patch("src.services.auth.UserService")
 @patch("src.services.auth.get_redis")
-@patch("src.services.auth.jwt.decode")
+@patch("src.services.auth.decode_token")
 async def test_get_current_user_from_redis(
     mock_jwt_decode, mock_get_redis, mock_user_service, fake_session, fake_user
 ):
@@ -94,19 +185,21 @@ async def test_get_current_user_from_redis(
         "confirmed": fake_user.confirmed,
         "role": fake_user.role,
     }
-    redis_mock.get.return_value = json.dumps(user_data)
+    redis_mock.mget.return_value = [json.dumps(user_data), None]
     mock_get_redis.return_value = redis_mock
 
     user = await get_current_user(token="faketoken", db=fake_session)
 
-    assert isinstance(user, SimpleNamespace)
+    assert isinstance(user, CachedUser)
     assert user.username == fake_user.username
-    redis_mock.get.assert_awaited_once()
+    redis_mock.mget.assert_awaited_once_with(
+        f"user:{fake_user.username}", f"user_gen:{fake_user.username}"
+    )
     mock_user_service.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch("src.services.auth.jwt.decode")
+@patch("src.services.auth.decode_token")
 @patch("src.services.auth.get_redis")
 @patch("src.services.auth.UserService")
 async def test_get_current_user_from_db(
@@ -115,28 +208,78 @@ async def test_get_current_user_from_db(
     mock_jwt_decode.return_value = {"sub": fake_user.username}
 
     redis_mock = AsyncMock()
-    redis_mock.get.return_value = None
-    redis_mock.set.return_value = AsyncMock()
+    redis_mock.mget.return_value = [None, "3"]
     mock_get_redis.return_value = redis_mock
 
     instance = mock_user_service.return_value
     instance.get_user_by_username = AsyncMock(return_value=fake_user)
 
     user = await get_current_user(token="faketoken", db=fake_session)
+    await asyncio.sleep(0)
 
     assert user.username == fake_user.username
-    redis_mock.get.assert_awaited_once()
-    redis_mock.set.assert_awaited_once()
+    redis_mock.mget.assert_awaited_once()
+    redis_mock.eval.assert_awaited_once()
+    args = redis_mock.eval.call_args.args
+    assert args[:6] == (
+        SET_IF_GENERATION,
+        2,
+        f"user_gen:{fake_user.username}",
+        f"user:{fake_user.username}",
+        "3",
+        USER_CACHE_TTL,
+    )
     instance.get_user_by_username.assert_awaited_once_with(fake_user.username)
 
 
 @pytest.mark.asyncio
-@patch("src.services.auth.jwt.decode", side_effect=JWTError("bad token"))
+@patch("src.services.auth.decode_token")
+@patch("src.services.auth.UserService")
+async def test_get_current_user_stale_read_not_cached_after_invalidation(
+    mock_user_service, mock_jwt_decode, fake_session, fake_user, generation_redis
+):
+    mock_jwt_decode.return_value = {"sub": fake_user.username}
+    redis = generation_redis
+
+    async def load_then_concurrent_invalidation(username):
+        # The user confirms their email while this request is still loading them.
+        await invalidate_cached_user(username)
+        return fake_user
+
+    mock_user_service.return_value.get_user_by_username = AsyncMock(
+        side_effect=load_then_concurrent_invalidation
+    )
+
+    with patch("src.services.auth.get_redis", AsyncMock(return_value=redis)):
+        user = await get_current_user(token="faketoken", db=fake_session)
+        await asyncio.sleep(0)
+
+    assert user.username == fake_user.username
+    assert f"user:{fake_user.username}" not in redis.data
+    assert redis.data[f"user_gen:{fake_user.username}"] == "1"
+
+
+@pytest.mark.asyncio
+@patch("src.services.auth.decode_token", side_effect=JWTError("bad token"))
 async def test_get_current_user_invalid_token(mock_jwt_decode, fake_session):
     with pytest.raises(HTTPException):
         await get_current_user(token="badtoken", db=fake_session)
 
 
+def test_get_email_token_reuses_token_within_minute():
+    with patch("src.services.auth.time.time", return_value=6000.0):
+        first = get_email_token("cached@example.com")
+        second = get_email_token("cached@example.com")
+    with patch("src.services.auth.time.time", return_value=6060.0):
+        third = get_email_token("cached@example.com")
+
+    payload = jwt.decode(
+        third, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+    )
+    assert first == second
+    assert payload["sub"] == "cached@example.com"
+
+
 def test_create_email_token_and_decode():
     data = {"sub": "email@example.com"}
     token = create_email_token(data)
@@ -163,7 +306,7 @@ async def test_get_email_from_token_invalid():
 
 
 @pytest.mark.asyncio
-@patch("src.services.auth.jwt.decode")
+@patch("src.services.auth.decode_token")
 async def test_verify_refresh_token_valid(mock_jwt_decode, fake_session):
     mock_jwt_decode.return_value = {"sub": "user1", "token_type": "refresh"}
     user_instance = MagicMock(spec=User)
@@ -173,13 +316,11 @@ async def test_verify_refresh_token_valid(mock_jwt_decode, fake_session):
     user = await verify_refresh_token("fake_refresh_token", fake_session)
     assert user == user_instance
 
-    mock_jwt_decode.assert_called_once_with(
-        "fake_refresh_token", "refresh_token", algorithms=["HS256"]
-    )
+    mock_jwt_decode.assert_called_once_with("fake_refresh_token", "refresh_token")
 
 
 @pytest.mark.asyncio
-@patch("src.services.auth.jwt.decode")
+@patch("src.services.auth.decode_token")
 async def test_verify_refresh_token_invalid_token_type(mock_jwt_decode, fake_session):
     mock_jwt_decode.return_value = {"sub": "user1", "token_type": "access"}
 
@@ -188,7 +329,41 @@ async def test_verify_refresh_token_invalid_token_type(mock_jwt_decode, fake_ses
 
 
 @pytest.mark.asyncio
-@patch("src.services.auth.jwt.decode", side_effect=JWTError("decode error"))
+@patch("src.services.auth.decode_token", side_effect=JWTError("decode error"))
 async def test_verify_refresh_token_decode_error(fake_session):
     with pytest.raises(HTTPException):
         await verify_refresh_token("invalid_token", fake_session)
+
+
+def make_pipeline_redis():
+    redis_mock = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_mock.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_mock.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return redis_mock, pipe
+
+
+@pytest.mark.asyncio
+@patch("src.services.auth.get_redis")
+async def test_invalidate_cached_user(mock_get_redis):
+    redis_mock, pipe = make_pipeline_redis()
+    mock_get_redis.return_value = redis_mock
+
+    await invalidate_cached_user("user1")
+
+    pipe.incr.assert_called_once_with("user_gen:user1")
+    pipe.delete.assert_called_once_with("user:user1")
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("src.services.auth.get_redis")
+async def test_invalidate_cached_user_redis_error(mock_get_redis):
+    redis_mock, pipe = make_pipeline_redis()
+    pipe.execute.side_effect = ConnectionError("redis down")
+    mock_get_redis.return_value = redis_mock
+
+    await invalidate_cached_user("user1")
+
+    pipe.execute.assert_awaited_once()
@@ -1,32 +1,73 @@
+import httpx
 import pytest
-from unittest.mock import patch
-from cloudinary.exceptions import Error as CloudinaryError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
 
-from src.services.cloudinary_service import CloudinaryService
+from cloudinary.utils import cloudinary_url
 
+from src.services import cloudinary_service as cloudinary_module
+from src.services.cloudinary_service import CloudinaryService, _build_url
 
-@pytest.fixture
-def cloudinary_service():
-    return CloudinaryService("test_cloud", "test_key", "test_secret", max_workers=2)
+pytestmark = pytest.mark.cloudinary
 
+mock_cloudinary_url = MagicMock(return_value=("http://cloudinary.com/test.jpg", None))
+client_post = AsyncMock()
+client_request = AsyncMock()
+UPLOAD_ERROR = httpx.HTTPError("Upload failed")
+DELETE_ERROR = httpx.HTTPError("Delete failed")
 
-@pytest.mark.asyncio
-@patch("src.services.cloudinary_service.upload")
-@patch("src.services.cloudinary_service.cloudinary_url")
-async def test_upload_file_success(
-    mock_cloudinary_url, mock_upload, cloudinary_service
-):
-    mock_upload.return_value = {"version": 123}
-    mock_cloudinary_url.return_value = ("http://cloudinary.com/test.jpg", None)
 
-    class FileMock:
-        file = "fake_file_data"
+@pytest.fixture(autouse=True, scope="module")
+def patch_cloudinary_url():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cloudinary_module, "cloudinary_url", mock_cloudinary_url)
+        yield
 
-    result = await cloudinary_service.upload_file(FileMock(), "public_id_test")
 
-    mock_upload.assert_called_once_with(
-        "fake_file_data", public_id="public_id_test", overwrite=True
-    )
+@pytest.fixture(autouse=True)
+def reset_cloudinary_url():
+    yield
+    mock_cloudinary_url.reset_mock()
+
+
+@pytest.fixture(scope="module")
+def shared_cloudinary_service():
+    return CloudinaryService("test_cloud", "test_key", "test_secret")
+
+
+@pytest.fixture
+def cloudinary_service(shared_cloudinary_service):
+    _build_url.cache_clear()
+    state = dict(vars(shared_cloudinary_service))
+    shared_cloudinary_service.client = Mock(post=client_post, request=client_request)
+    yield shared_cloudinary_service
+    client_post.reset_mock(return_value=True, side_effect=True)
+    client_request.reset_mock(return_value=True, side_effect=True)
+    vars(shared_cloudinary_service).clear()
+    vars(shared_cloudinary_service).update(state)
+
+
+upload = SimpleNamespace(
+    file="fake_file_data", filename="avatar.png", content_type="image/png"
+)
+
+
+@pytest.mark.asyncio
+async def test_upload_file_success(cloudinary_service):
+    response = MagicMock()
+    response.json.return_value = {"version": 123}
+    client_post.return_value = response
+
+    result = await cloudinary_service.upload_file(upload, "public_id_test")
+
+    client_post.assert_awaited_once()
+    url = client_post.call_args.args[0]
+    kwargs = client_post.call_args.kwargs
+    assert url == "https://api.cloudinary.com/v1_1/test_cloud/image/upload"
+    assert kwargs["data"]["public_id"] == "public_id_test"
+    assert kwargs["data"]["api_key"] == "test_key"
+    assert "signature" in kwargs["data"]
+    assert kwargs["files"] == {"file": ("avatar.png", "fake_file_data", "image/png")}
     mock_cloudinary_url.assert_called_once_with(
         "public_id_test", width=250, height=250, crop="fill", version=123
     )
@@ -34,37 +75,47 @@ async def test_upload_file_success(
 
 
 @pytest.mark.asyncio
-@patch(
-    "src.services.cloudinary_service.upload",
-    side_effect=CloudinaryError("Upload failed"),
-)
-async def test_upload_file_failure(mock_upload, cloudinary_service):
-    class FileMock:
-        file = "fake_file_data"
+async def test_upload_file_failure(cloudinary_service):
+    client_post.side_effect = UPLOAD_ERROR
 
     with pytest.raises(Exception) as exc_info:
-        await cloudinary_service.upload_file(FileMock(), "public_id_test")
+        await cloudinary_service.upload_file(upload, "public_id_test")
 
     assert "Помилка при завантаженні файлу" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-@patch("src.services.cloudinary_service.destroy")
-async def test_delete_file_success(mock_destroy, cloudinary_service):
-    mock_destroy.return_value = {"result": "ok"}
+async def test_upload_file_background_swallows_error(cloudinary_service):
+    cloudinary_service.upload_file = AsyncMock(side_effect=Exception("Upload failed"))
+    file = MagicMock()
+    file.close = AsyncMock()
+
+    await cloudinary_service.upload_file_background(file, "public_id_test")
+
+    cloudinary_service.upload_file.assert_awaited_once_with(file, "public_id_test")
+    file.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_file_success(cloudinary_service):
+    response = MagicMock()
+    response.json.return_value = {"result": "ok"}
+    client_post.return_value = response
 
     result = await cloudinary_service.delete_file("public_id_test")
 
-    mock_destroy.assert_called_once_with("public_id_test")
+    url = client_post.call_args.args[0]
+    data = client_post.call_args.kwargs["data"]
+    assert url == "https://api.cloudinary.com/v1_1/test_cloud/image/destroy"
+    assert data["public_id"] == "public_id_test"
+    assert "signature" in data
     assert result == {"result": "ok"}
 
 
 @pytest.mark.asyncio
-@patch(
-    "src.services.cloudinary_service.destroy",
-    side_effect=CloudinaryError("Delete failed"),
-)
-async def test_delete_file_failure(mock_destroy, cloudinary_service):
+async def test_delete_file_failure(cloudinary_service):
+    client_post.side_effect = DELETE_ERROR
+
     with pytest.raises(Exception) as exc_info:
         await cloudinary_service.delete_file("public_id_test")
 
@@ -72,15 +123,42 @@ async def test_delete_file_failure(mock_destroy, cloudinary_service):
 
 
 @pytest.mark.asyncio
-async def test_build_url(cloudinary_service):
-    with patch(
-        "src.services.cloudinary_service.cloudinary_url",
-        return_value=("http://cloudinary.com/test.jpg", None),
-    ) as mock_cloudinary_url:
-        url = await cloudinary_service.build_url(
-            "public_id_test", width=300, height=300
-        )
-        mock_cloudinary_url.assert_called_once_with(
-            "public_id_test", width=300, height=300, crop="fill"
-        )
-        assert url == "http://cloudinary.com/test.jpg"
+async def test_delete_files_batches_requests(cloudinary_service):
+    public_ids = [f"id_{i}" for i in range(150)]
+    response = MagicMock()
+    response.json.side_effect = [
+        {"deleted": {pid: "deleted" for pid in public_ids[:100]}},
+        {"deleted": {pid: "deleted" for pid in public_ids[100:]}},
+    ]
+    client_request.return_value = response
+
+    result = await cloudinary_service.delete_files(public_ids)
+
+    assert client_request.await_count == 2
+    first_call = client_request.call_args_list[0]
+    assert first_call.args == (
+        "DELETE",
+        "https://api.cloudinary.com/v1_1/test_cloud/resources/image/upload",
+    )
+    assert len(first_call.kwargs["params"]) == 100
+    assert first_call.kwargs["auth"] == ("test_key", "test_secret")
+    assert len(result) == 150
+
+
+@pytest.mark.parametrize("public_id", ["public_id_test", "RestApp/testuser"])
+def test_build_url_plain_public_id_matches_cloudinary(cloudinary_service, public_id):
+    url = cloudinary_service.build_url(public_id, width=300, height=300)
+
+    mock_cloudinary_url.assert_not_called()
+    expected, _ = cloudinary_url(public_id, width=300, height=300, crop="fill")
+    assert url == expected
+
+
+def test_build_url(cloudinary_service):
+    url = cloudinary_service.build_url("public id test", width=300, height=300)
+    cached = cloudinary_service.build_url("public id test", width=300, height=300)
+
+    mock_cloudinary_url.assert_called_once_with(
+        "public id test", width=300, height=300, crop="fill", version=None
+    )
+    assert url == cached == "http://cloudinary.com/test.jpg"
@@ -0,0 +1,212 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from src.schemas import ContactResponse
+from src.services.contacts import CONTACT_CACHE_TTL, ContactService
+from src.services.redis_cache import GET_WITH_GENERATION, SET_IF_GENERATION
+
+pytestmark = pytest.mark.contacts
+
+
+def contact_json(fake_contact):
+    return ContactResponse.model_validate(fake_contact).model_dump_json()
+
+
+def make_redis(cached=None, generation=None):
+    redis = MagicMock()
+    redis.mget = AsyncMock(return_value=[cached, generation])
+    redis.eval = AsyncMock(return_value=[generation or "0", cached])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return redis, pipe
+
+
+@pytest.mark.asyncio
+async def test_get_contact_by_id_cache_hit(fake_user, fake_contact):
+    redis, _ = make_redis(cached=contact_json(fake_contact))
+    repo = AsyncMock()
+
+    with patch("src.services.contacts.get_redis", AsyncMock(return_value=redis)):
+        result = await ContactService(repo).get_contact_by_id(1, fake_user)
+
+    assert result == ContactResponse.model_validate(fake_contact)
+    redis.mget.assert_awaited_once_with(
+        f"contact:{fake_user.id}:1", f"contacts_gen:{fake_user.id}"
+    )
+    repo.get_contact_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_contact_by_id_cache_miss(fake_user, fake_contact):
+    redis, _ = make_redis()
+    repo = AsyncMock()
+    repo.get_contact_by_id.return_value = fake_contact
+
+    with patch("src.services.contacts.get_redis", AsyncMock(return_value=redis)):
+        result = await ContactService(repo).get_contact_by_id(1, fake_user)
+
+    assert result == ContactResponse.model_validate(fake_contact)
+    redis.eval.assert_awaited_once_with(
+        SET_IF_GENERATION,
+        2,
+        f"contacts_gen:{fake_user.id}",
+        f"contact:{fake_user.id}:1",
+        "0",
+        CONTACT_CACHE_TTL,
+        contact_json(fake_contact),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_contact_by_id_redis_down(fake_user, fake_contact):
+    repo = AsyncMock()
+    repo.get_contact_by_id.return_value = fake_contact
+
+    with patch(
+        "src.services.contacts.get_redis",
+        AsyncMock(side_effect=ConnectionError("redis down")),
+    ):
+        result = await ContactService(repo).get_contact_by_id(1, fake_user)
+
+    assert isinstance(result, ContactResponse)
+    assert result.id == fake_contact.id
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_cache_hit(fake_user, fake_contact):
+    redis, _ = make_redis(cached=f"[{contact_json(fake_contact)}]")
+    repo = AsyncMock()
+
+    with patch("src.services.contacts.get_redis", AsyncMock(return_value=redis)):
+        result = await ContactService(repo).list_contacts(fake_user, skip=0, limit=5)
+
+    assert [c.id for c in result] == [fake_contact.id]
+    redis.eval.assert_awaited_once_with(
+        GET_WITH_GENERATION,
+        1,
+        f"contacts_gen:{fake_user.id}",
+        f"contacts:{fake_user.id}:",
+        ":0:5:None",
+    )
+    repo.get_contacts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_contact_invalidates_cache(fake_user):
+    redis, pipe = make_redis()
+    repo = AsyncMock()
+    repo.delete_contact.return_value = True
+
+    with patch("src.services.contacts.get_redis", AsyncMock(return_value=redis)):
+        await ContactService(repo).delete_contact(1, fake_user)
+
+    pipe.incr.assert_called_once_with(f"contacts_gen:{fake_user.id}")
+    pipe.delete.assert_called_once_with(f"contact:{fake_user.id}:1")
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_contact_not_found(fake_user):
+    repo = AsyncMock()
+    repo.delete_contact.return_value = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ContactService(repo).delete_contact(1, fake_user)
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_contact_duplicate_email(fake_user, fake_contact_data):
+    repo = AsyncMock()
+    repo.email_exists.return_value = 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ContactService(repo).create_contact(fake_contact_data, fake_user)
+
+    assert exc_info.value.status_code == 400
+    repo.create_contact.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_contact_concurrent_duplicate_email(fake_user, fake_contact_data):
+    repo = AsyncMock()
+    repo.email_exists.return_value = None
+    repo.create_contact.side_effect = IntegrityError(
+        "INSERT INTO contacts", {}, Exception("duplicate")
+    )
+
+    with patch("src.services.contacts.get_redis") as mock_get_redis:
+        with pytest.raises(HTTPException) as exc_info:
+            await ContactService(repo).create_contact(fake_contact_data, fake_user)
+
+    assert exc_info.value.status_code == 400
+    mock_get_redis.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_json_etag_stable_across_cache(fake_user, fake_contact):
+    redis, _ = make_redis()
+    repo = AsyncMock()
+    repo.get_contacts.return_value = [fake_contact]
+
+    with patch("src.services.contacts.get_redis", AsyncMock(return_value=redis)):
+        body, etag = await ContactService(repo).list_contacts_json(fake_user)
+        redis.eval.return_value = ["0", body.decode()]
+        cached_body, cached_etag = await ContactService(repo).list_contacts_json(
+            fake_user
+        )
+
+    assert cached_body == body
+    assert cached_etag == etag
+    assert etag.startswith('"') and etag.endswith('"')
+    repo.get_contacts.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_stale_read_not_cached_after_write(
+    fake_user, fake_contact, generation_redis
+):
+    redis = generation_redis
+    repo = AsyncMock()
+    service = ContactService(repo)
+
+    async def read_then_concurrent_delete(*args, **kwargs):
+        # Another request deletes a contact while this read is in flight.
+        repo.delete_contact.return_value = True
+        await service.delete_contact(fake_contact.id, fake_user)
+        return [fake_contact]
+
+    repo.get_contacts.side_effect = read_then_concurrent_delete
+
+    with patch("src.services.contacts.get_redis", AsyncMock(return_value=redis)):
+        await service.list_contacts_json(fake_user)
+
+    assert f"contacts:{fake_user.id}:0:0:10:None" not in redis.data
+    assert redis.data[f"contacts_gen:{fake_user.id}"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_cached_page_retired_by_write(
+    fake_user, fake_contact, generation_redis
+):
+    repo = AsyncMock()
+    repo.get_contacts.return_value = [fake_contact]
+    repo.delete_contact.return_value = True
+    service = ContactService(repo)
+
+    with patch(
+        "src.services.contacts.get_redis", AsyncMock(return_value=generation_redis)
+    ):
+        await service.list_contacts(fake_user)
+        await service.list_contacts(fake_user)
+        await service.delete_contact(fake_contact.id, fake_user)
+        repo.get_contacts.return_value = []
+        result = await service.list_contacts(fake_user)
+
+    assert result == []
+    assert repo.get_contacts.await_count == 2
@@ -1,76 +1,71 @@
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi_mail.errors import ConnectionErrors
 
+from src.services import email as email_service
 from src.services.email import send_email, send_password_reset_email
 
+pytestmark = pytest.mark.email
 
-@pytest.mark.asyncio
-@patch("src.services.email.FastMail.send_message", new_callable=AsyncMock)
-@patch("src.services.email.create_email_token", return_value="test_token")
-async def test_send_email_success(mock_token, mock_send):
-    email = "user@example.com"
-    username = "testuser"
-    host = "http://localhost:8000"
-
-    await send_email(email, username, host)
+send_message = AsyncMock()
+get_email_token = MagicMock(return_value="test_token")
+SMTP_ERROR = ConnectionErrors("SMTP Error")
 
-    mock_send.assert_called_once()
-    args, kwargs = mock_send.call_args
 
-    # Перевіримо, що шаблон правильний
-    assert kwargs["template_name"] == "verify_email.html"
-    # Перевіримо, що в тілі повідомлення є потрібні ключі
-    body = args[0].template_body
-    assert body["host"] == host
-    assert body["username"] == username
-    assert body["token"] == "test_token"
+@pytest.fixture(autouse=True, scope="module")
+def patch_mail_surface():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(email_service.FastMail, "send_message", send_message)
+        mp.setattr(email_service, "get_email_token", get_email_token)
+        yield
 
 
-@pytest.mark.asyncio
-@patch("src.services.email.FastMail.send_message", new_callable=AsyncMock)
-async def test_send_password_reset_email_success(mock_send):
-    email = "user@example.com"
-    username = "testuser"
-    reset_link = "http://localhost:8000/reset?token=abc123"
+@pytest.fixture(autouse=True)
+def reset_mail_mocks():
+    yield
+    send_message.reset_mock(side_effect=True)
+    get_email_token.reset_mock()
 
-    await send_password_reset_email(email, username, reset_link)
 
-    mock_send.assert_called_once()
-    args, kwargs = mock_send.call_args
+HOST = "http://localhost:8000"
+RESET_LINK = "http://localhost:8000/reset?token=abc123"
 
-    assert kwargs["template_name"] == "reset_password.html"
-    body = args[0].template_body
-    assert body["username"] == username
-    assert body["reset_link"] == reset_link
+SENDERS = [
+    pytest.param(
+        send_email,
+        ("user@example.com", "testuser", HOST),
+        [f"{HOST}api/auth/confirmed_email/test_token", "Hi testuser,"],
+        id="verify",
+    ),
+    pytest.param(
+        send_password_reset_email,
+        ("user@example.com", "testuser", RESET_LINK),
+        [f'href="{RESET_LINK}"', "testuser"],
+        id="reset",
+    ),
+]
 
 
 @pytest.mark.asyncio
-@patch(
-    "src.services.email.FastMail.send_message",
-    side_effect=ConnectionErrors("SMTP Error"),
-)
-@patch("src.services.email.create_email_token", return_value="test_token")
-async def test_send_email_failure_logs_error(mock_token, mock_send, caplog):
-    email = "user@example.com"
-    username = "testuser"
-    host = "http://localhost:8000"
+@pytest.mark.parametrize("sender,args,fragments", SENDERS)
+async def test_send_success(sender, args, fragments):
+    await sender(*args)
 
-    with caplog.at_level("ERROR"):
-        await send_email(email, username, host)
-        assert "Email sending failed" in caplog.text
+    send_message.assert_called_once()
+    call_args, kwargs = send_message.call_args
+
+    # Перевіримо, що шаблон відрендерено в тіло повідомлення
+    assert "template_name" not in kwargs
+    assert call_args[0].recipients[0].email == args[0]
+    for fragment in fragments:
+        assert fragment in call_args[0].body
 
 
 @pytest.mark.asyncio
-@patch(
-    "src.services.email.FastMail.send_message",
-    side_effect=ConnectionErrors("SMTP Error"),
-)
-async def test_send_password_reset_email_failure_logs_error(mock_send, caplog):
-    email = "user@example.com"
-    username = "testuser"
-    reset_link = "http://localhost/reset"
-
-    with caplog.at_level("ERROR"):
-        await send_password_reset_email(email, username, reset_link)
-        assert "Email sending failed" in caplog.text
+@pytest.mark.parametrize("sender,args,fragments", SENDERS)
+async def test_send_failure_logs_error(sender, args, fragments, caplog):
+    send_message.side_effect = SMTP_ERROR
+
+    await sender(*args)
+
+    assert "Email sending failed" in caplog.text
@@ -1,23 +1,33 @@
 import pytest
-from unittest.mock import patch, MagicMock
-from src.services.redis_cache import get_redis, redis
+from unittest.mock import AsyncMock, Mock, patch
+from src.services.redis_cache import close_redis, get_redis, redis
 from src.services import redis_cache
 
+pytestmark = pytest.mark.redis
+
 
 @pytest.mark.asyncio
 async def test_get_redis_creates_instance():
-    redis_cache.redis = None
-
-    with patch("src.services.redis_cache.Redis") as mock_redis_class:
-        mock_redis_instance = MagicMock()
-        mock_redis_class.from_url.return_value = mock_redis_instance
+    with (
+        patch("src.services.redis_cache.Redis") as mock_redis_class,
+        patch("src.services.redis_cache.ConnectionPool") as mock_pool_class,
+    ):
+        mock_redis_instance = Mock()
+        mock_redis_class.return_value = mock_redis_instance
 
         client = await get_redis()
 
-        mock_redis_class.from_url.assert_called_once_with(
+        mock_pool_class.from_url.assert_called_once_with(
             redis_cache.settings.REDIS_URL,
             encoding="utf-8",
             decode_responses=True,
+            max_connections=redis_cache.settings.REDIS_POOL_SIZE,
+            socket_keepalive=True,
+            health_check_interval=30,
+            protocol=3,
+        )
+        mock_redis_class.assert_called_once_with(
+            connection_pool=mock_pool_class.from_url.return_value
         )
 
         assert client == mock_redis_instance
@@ -25,15 +35,28 @@ async def test_get_redis_creates_instance():
 
 @pytest.mark.asyncio
 async def test_get_redis_returns_cached_instance():
-    redis_cache.redis = None
-
-    with patch("src.services.redis_cache.Redis") as mock_redis_class:
-        mock_redis_instance = MagicMock()
-        mock_redis_class.from_url.return_value = mock_redis_instance
-
+    with (
+        patch("src.services.redis_cache.Redis") as mock_redis_class,
+        patch("src.services.redis_cache.ConnectionPool") as mock_pool_class,
+    ):
         client1 = await get_redis()
         client2 = await get_redis()
 
-        mock_redis_class.from_url.assert_called_once()
+        mock_pool_class.from_url.assert_called_once()
+        mock_redis_class.assert_called_once()
 
         assert client1 == client2
+
+
+@pytest.mark.asyncio
+async def test_close_redis_disconnects_pool():
+    mock_redis_instance = Mock()
+    mock_redis_instance.aclose = AsyncMock()
+    mock_redis_instance.connection_pool.disconnect = AsyncMock()
+    redis_cache.redis = mock_redis_instance
+
+    await close_redis()
+
+    mock_redis_instance.aclose.assert_awaited_once()
+    mock_redis_instance.connection_pool.disconnect.assert_awaited_once()
+    assert redis_cache.redis is None